@@ -5,7 +5,7 @@
 
 import sqlite3
 import os
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import logging
 import sys
@@ -15,12 +15,16 @@ import io
 # UTF-8 전역 설정 (최우선 실행)
 # ========================================
 # Windows 콘솔 코드 페이지를 UTF-8로 설정
+# 대화형 콘솔에서만 적용하고, 이미 UTF-8이면 다시 설정하지 않음
 if sys.platform == 'win32':
     try:
-        import ctypes
-        kernel32 = ctypes.windll.kernel32
-        kernel32.SetConsoleCP(65001)
-        kernel32.SetConsoleOutputCP(65001)
+        if sys.stdout is not None and sys.stdout.isatty():
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if kernel32.GetConsoleCP() != 65001:
+                kernel32.SetConsoleCP(65001)
+            if kernel32.GetConsoleOutputCP() != 65001:
+                kernel32.SetConsoleOutputCP(65001)
     except Exception:
         pass
 
@@ -123,6 +127,40 @@ class DatabaseManager:
                 )
             """)
             
+            # 파일 내용 해시 테이블 (내용이 같은 파일은 텍스트 추출 생략)
+            # digest: 내용 해시 ('' = 계산하지 않음), size: 파일 크기 (크기가 같은 파일이 있을 때만 해시 계산)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS content_hashes (
+                    path TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL,
+                    size INTEGER
+                )
+            """)
+            # 이전 버전 DB에는 size 컬럼이 없음
+            columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(content_hashes)")}
+            if 'size' not in columns:
+                self.conn.execute("ALTER TABLE content_hashes ADD COLUMN size INTEGER")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_content_hashes_digest ON content_hashes(digest)"
+            )
+            
+            # 요약 정보만 인덱싱된 파일 테이블 (반복 실패한 문서 - 다음 인덱싱에서 전체 추출 재시도)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS degraded_files (
+                    path TEXT PRIMARY KEY
+                )
+            """)
+            
+            # 재시도 대기 파일 테이블 (재시작 후에도 재시도 큐 유지)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS skipped_files (
+                    path TEXT PRIMARY KEY,
+                    reason TEXT,
+                    retry_count INTEGER NOT NULL DEFAULT 0,
+                    added_at REAL NOT NULL
+                )
+            """)
+            
             self.conn.commit()
             logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
             
@@ -224,6 +262,38 @@ class DatabaseManager:
             logger.error(f"파일 인덱스 업데이트 오류 [{path}]: {e}")
             raise
     
+    def update_files_batch(self, files: List[Tuple[str, str, float]]):
+        """
+        파일 인덱스 배치 업데이트 (없는 파일은 추가, 한 트랜잭션으로 커밋)
+        
+        Args:
+            files: [(path, content, mtime), ...] 형태의 리스트
+        """
+        if not files:
+            return
+        
+        try:
+            self.conn.execute("BEGIN TRANSACTION")
+            for path, content, mtime in files:
+                cursor = self.conn.execute(
+                    "UPDATE files_fts SET content = ?, mtime = ? WHERE path = ?",
+                    (content, str(mtime), path)
+                )
+                if cursor.rowcount == 0:
+                    self.conn.execute(
+                        "INSERT INTO files_fts (path, content, mtime) VALUES (?, ?, ?)",
+                        (path, content, str(mtime))
+                    )
+            self.conn.commit()
+            logger.debug(f"✓ 배치 인덱스 업데이트 완료 (커밋됨): {len(files)}개 파일")
+        except sqlite3.Error as e:
+            try:
+                self.conn.rollback()
+                logger.error(f"배치 인덱스 업데이트 실패 - 롤백됨: {e}")
+            except:
+                logger.error(f"롤백 실패: {e}")
+            raise
+    
     def delete_file(self, path: str):
         """
         파일 인덱스 삭제
@@ -233,6 +303,8 @@ class DatabaseManager:
         """
         try:
             self.conn.execute("DELETE FROM files_fts WHERE path = ?", (path,))
+            self.conn.execute("DELETE FROM content_hashes WHERE path = ?", (path,))
+            self.conn.execute("DELETE FROM degraded_files WHERE path = ?", (path,))
             self.conn.commit()
             logger.debug(f"파일 인덱스 삭제: {path}")
         except sqlite3.Error as e:
@@ -373,6 +445,103 @@ class DatabaseManager:
             logger.error(f"mtime 조회 오류 [{path}]: {e}")
             return None
     
+    def get_all_indexed_mtimes(self) -> Dict[str, float]:
+        """
+        인덱싱된 모든 파일의 마지막 수정 시간 일괄 조회 (증분 색인용)
+        
+        파일마다 get_file_mtime을 호출하는 대신 한 번의 쿼리로 가져옵니다.
+        
+        Returns:
+            {파일 경로: 마지막 수정 시간 (UNIX timestamp)}
+        """
+        try:
+            cursor = self.conn.execute("SELECT path, mtime FROM files_fts")
+            return {row['path']: float(row['mtime']) for row in cursor}
+        except sqlite3.Error as e:
+            logger.error(f"mtime 일괄 조회 오류: {e}")
+            return {}
+    
+    def update_file_mtime(self, path: str, mtime: float):
+        """
+        파일의 마지막 수정 시간만 갱신 (내용이 그대로인 파일용)
+        
+        Args:
+            path: 파일 절대 경로
+            mtime: 마지막 수정 시간 (UNIX timestamp)
+        """
+        try:
+            self.conn.execute(
+                "UPDATE files_fts SET mtime = ? WHERE path = ?",
+                (str(mtime), path)
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            logger.error(f"mtime 갱신 오류 [{path}]: {e}")
+            raise
+    
+    def get_file_content(self, path: str) -> Optional[str]:
+        """
+        인덱싱된 파일 텍스트 조회
+        
+        Args:
+            path: 파일 절대 경로
+        
+        Returns:
+            파일 텍스트 내용 또는 None
+        """
+        try:
+            cursor = self.conn.execute(
+                "SELECT content FROM files_fts WHERE path = ?",
+                (path,)
+            )
+            row = cursor.fetchone()
+            return row['content'] if row else None
+        except sqlite3.Error as e:
+            logger.error(f"파일 내용 조회 오류 [{path}]: {e}")
+            return None
+    
+    def get_all_content_hashes(self) -> Dict[str, Tuple[str, Optional[int]]]:
+        """
+        인덱싱된 파일의 내용 해시와 크기 일괄 조회
+        
+        Returns:
+            {파일 경로: (내용 해시, 파일 크기)} - 해시를 계산하지 않은 파일은 내용 해시가 ''
+        """
+        try:
+            cursor = self.conn.execute("SELECT path, digest, size FROM content_hashes")
+            return {row['path']: (row['digest'], row['size']) for row in cursor}
+        except sqlite3.Error as e:
+            logger.error(f"내용 해시 조회 오류: {e}")
+            return {}
+    
+    def set_content_hashes(self, hashes: List[Tuple[str, str, Optional[int]]]):
+        """
+        파일 내용 해시 배치 저장
+        
+        Args:
+            hashes: [(path, digest, size), ...] 형태의 리스트 (해시를 계산하지 않았으면 digest='')
+        """
+        if not hashes:
+            return
+        
+        try:
+            self.conn.execute("BEGIN TRANSACTION")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO content_hashes (path, digest, size) VALUES (?, ?, ?)",
+                hashes
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            logger.error(f"내용 해시 저장 오류: {e}")
+    
     def get_all_indexed_file_paths(self) -> List[str]:
         """
         인덱싱된 모든 파일 경로 조회 (삭제된 파일 정리용)
@@ -438,6 +607,8 @@ class DatabaseManager:
         """모든 인덱스 삭제"""
         try:
             self.conn.execute("DELETE FROM files_fts")
+            self.conn.execute("DELETE FROM content_hashes")
+            self.conn.execute("DELETE FROM degraded_files")
             self.conn.commit()
             logger.info("모든 인덱스 삭제 완료")
         except sqlite3.Error as e:
@@ -564,6 +735,84 @@ class DatabaseManager:
             logger.error(f"파일 상세 조회 오류 [{path}]: {e}")
             return None
     
+    def get_degraded_files(self) -> set:
+        """
+        요약 정보만 인덱싱된 파일 경로 조회
+        
+        Returns:
+            파일 경로 집합
+        """
+        try:
+            cursor = self.conn.execute("SELECT path FROM degraded_files")
+            return {row['path'] for row in cursor}
+        except sqlite3.Error as e:
+            logger.error(f"요약 인덱싱 파일 조회 오류: {e}")
+            return set()
+    
+    def set_degraded_files(self, paths: List[str], degraded: bool = True):
+        """
+        요약 정보만 인덱싱된 파일 표시/해제
+        
+        Args:
+            paths: 파일 경로 리스트
+            degraded: True면 표시, False면 해제 (전체 텍스트로 다시 인덱싱된 경우)
+        """
+        if not paths:
+            return
+        
+        try:
+            if degraded:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO degraded_files (path) VALUES (?)",
+                    [(path,) for path in paths]
+                )
+            else:
+                self.conn.executemany(
+                    "DELETE FROM degraded_files WHERE path = ?",
+                    [(path,) for path in paths]
+                )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"요약 인덱싱 파일 표시 오류: {e}")
+    
+    def get_skipped_files(self) -> List[Tuple[str, str, int, float]]:
+        """
+        저장된 재시도 대기 파일 조회 (추가된 순서대로)
+        
+        Returns:
+            [(path, reason, retry_count, added_at), ...]
+        """
+        try:
+            cursor = self.conn.execute(
+                "SELECT path, reason, retry_count, added_at FROM skipped_files ORDER BY added_at"
+            )
+            return [(row['path'], row['reason'], row['retry_count'], row['added_at']) for row in cursor]
+        except sqlite3.Error as e:
+            logger.error(f"재시도 대기 파일 조회 오류: {e}")
+            return []
+    
+    def save_skipped_files(self, entries: List[Tuple[str, str, int, float]]):
+        """
+        재시도 대기 파일 목록 저장 (기존 목록을 한 트랜잭션으로 교체)
+        
+        Args:
+            entries: [(path, reason, retry_count, added_at), ...]
+        """
+        try:
+            self.conn.execute("BEGIN TRANSACTION")
+            self.conn.execute("DELETE FROM skipped_files")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO skipped_files (path, reason, retry_count, added_at) VALUES (?, ?, ?, ?)",
+                entries
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            try:
+                self.conn.rollback()
+            except:
+                pass
+            logger.error(f"재시도 대기 파일 저장 오류: {e}")
+    
     def add_search_history(self, keyword: str):
         """
         검색 히스토리 추가 또는 업데이트
@@ -7,9 +7,20 @@ PyQt6 GUI for Advanced Explorer
 import sys
 import os
 import io
+import json
 import requests
+from collections import deque, OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 
+# 빠른 JSON 파서 (선택적, 없으면 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ========================================
 # UTF-8 전역 설정 (최우선 실행)
 # ========================================
@@ -19,25 +30,100 @@ if sys.stderr.encoding != 'utf-8':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 # Windows 콘솔 코드 페이지를 UTF-8로 설정 (가능한 경우)
+# 대화형 콘솔에서만 적용하고, 이미 UTF-8이면 다시 설정하지 않음
 if sys.platform == 'win32':
     try:
-        import ctypes
-        kernel32 = ctypes.windll.kernel32
-        kernel32.SetConsoleCP(65001)  # UTF-8 입력
-        kernel32.SetConsoleOutputCP(65001)  # UTF-8 출력
+        if sys.stdout is not None and sys.stdout.isatty():
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if kernel32.GetConsoleCP() != 65001:
+                kernel32.SetConsoleCP(65001)  # UTF-8 입력
+            if kernel32.GetConsoleOutputCP() != 65001:
+                kernel32.SetConsoleOutputCP(65001)  # UTF-8 출력
     except Exception:
         pass
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QComboBox, QTreeWidget, QTreeWidgetItem,
-    QTextEdit, QProgressBar, QSplitter, QFrame, QHeaderView, QMessageBox
+    QPlainTextEdit, QProgressBar, QSplitter, QFrame, QHeaderView, QMessageBox
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
+from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont, QColor
 
+# 자주 쓰는 Qt 열거형 값 (매번 속성 체인을 조회하지 않도록 캐시)
+USER_ROLE = Qt.ItemDataRole.UserRole
+MSG_YES = QMessageBox.StandardButton.Yes
+MSG_NO = QMessageBox.StandardButton.No
+
 # Flask API 기본 URL
 API_BASE_URL = 'http://127.0.0.1:5000/api'
 
+# 엔드포인트 URL (요청마다 문자열 포맷팅하지 않도록 미리 생성)
+URL_HEALTH = f"{API_BASE_URL}/health"
+URL_SEARCH = f"{API_BASE_URL}/search/combined"
+URL_SEARCH_STREAM = f"{API_BASE_URL}/search/combined/stream"
+URL_IDX_START = f"{API_BASE_URL}/indexing/start"
+URL_IDX_STOP = f"{API_BASE_URL}/indexing/stop"
+URL_IDX_STATUS = f"{API_BASE_URL}/indexing/status"
+URL_IDX_STREAM = f"{API_BASE_URL}/indexing/stream"
+URL_INDEXED_CONTENT = f"{API_BASE_URL}/indexing/indexed-content"
+URL_STATS = f"{API_BASE_URL}/statistics"
+
+# 파일 크기 단위
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# 상태 표시줄 스타일
+STATUS_STYLE_DEFAULT = "QLabel { padding: 5px; background-color: #f0f0f0; }"
+STATUS_STYLE_OK = "QLabel { padding: 5px; background-color: #d4edda; color: #155724; }"
+STATUS_STYLE_WARN = "QLabel { padding: 5px; background-color: #fff3cd; color: #856404; }"
+STATUS_STYLE_ERROR = "QLabel { padding: 5px; background-color: #f8d7da; color: #721c24; }"
+
+# 로그 창별 최대 보관 줄 수 및 화면 반영 주기 (ms)
+LOG_MAX_LINES = 500
+LOG_FLUSH_INTERVAL_MS = 200
+
+# 내용 미리보기 최대 글자 수 (백엔드에도 전달해 필요한 만큼만 수신)
+CONTENT_PREVIEW_CHARS = 5000
+
+# 검색어 기록 최대 개수
+SEARCH_HISTORY_SIZE = 50
+
+# 내용 미리보기 캐시 크기 (최근 조회한 파일 수)
+CONTENT_CACHE_SIZE = 32
+
+# 스트리밍 검색 결과를 GUI로 보내는 묶음 크기
+SEARCH_STREAM_BATCH_SIZE = 25
+
+# 검색 결과 렌더링 배치 크기 (배치 사이에 이벤트 루프에 제어 반환)
+RESULT_RENDER_BATCH_SIZE = 50
+
+# 공유 HTTP 세션 (연결 풀링 + Keep-Alive로 요청마다 TCP 연결 생성 방지)
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+SESSION.headers['Connection'] = 'keep-alive'
+SESSION.headers['User-Agent'] = 'AdvancedExplorer-PyQt6'
+SESSION.headers['Accept-Encoding'] = 'gzip, deflate'
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _json_loads(data):
+    """JSON 디코딩 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """JSON 인코딩 - 요청 본문용 UTF-8 바이트 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 
 class SearchWorker(QThread):
     """검색 Worker Thread"""
@@ -46,6 +132,7 @@ class SearchWorker(QThread):
     progress_signal = pyqtSignal(int, int)  # current, total
     log_signal = pyqtSignal(str)  # message
     status_signal = pyqtSignal(str)  # status text
+    batch_signal = pyqtSignal(list)  # 스트리밍 중 도착한 결과 일부
     finished_signal = pyqtSignal(list)  # results
     
     def __init__(self, query: str, search_path: str = None):
@@ -53,6 +140,7 @@ class SearchWorker(QThread):
         self.query = query
         self.search_path = search_path
         self.is_running = True
+        self.results: List[Dict] = []  # 지금까지 받은 결과 (스트림 중 오류 시에도 유지)
     
     def run(self):
         """검색 실행"""
@@ -60,34 +148,91 @@ class SearchWorker(QThread):
             self.status_signal.emit(f"검색 중: '{self.query}'...")
             self.log_signal.emit(f"검색 시작: {self.query}")
             
-            # Flask API 호출
-            response = requests.post(
-                f"{API_BASE_URL}/search/combined",
-                json={
-                    'query': self.query,
-                    'search_path': self.search_path,
-                    'max_results': 100
-                },
-                timeout=30
-            )
+            payload = _json_dumps({
+                'query': self.query,
+                'search_path': self.search_path,
+                'max_results': 100,
+                'offset': 0
+            })
             
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get('results', [])
-                count = len(results)
-                
-                self.log_signal.emit(f"Found {count} results for '{self.query}'")
-                self.status_signal.emit(f"검색 완료: {count}개 결과")
-                self.finished_signal.emit(results)
-            else:
-                self.log_signal.emit(f"Error: {response.status_code}")
-                self.status_signal.emit("검색 오류")
-                self.finished_signal.emit([])
+            # NDJSON 스트림으로 결과를 받으면서 묶음 단위로 GUI에 전달
+            results = self._search_stream(payload)
+            if results is None:
+                # 스트리밍 미지원 백엔드면 기존 방식으로 한 번에 조회
+                results = self._search_once(payload)
+            if results is None or not self.is_running:
+                return
+            
+            count = len(results)
+            self.log_signal.emit(f"Found {count} results for '{self.query}'")
+            self.status_signal.emit(f"검색 완료: {count}개 결과")
+            self.finished_signal.emit(results)
         
         except Exception as e:
             self.log_signal.emit(f"Error: {str(e)}")
             self.status_signal.emit("검색 실패")
-            self.finished_signal.emit([])
+            # 스트리밍으로 이미 화면에 추가된 결과는 버리지 않음
+            self.finished_signal.emit(self.results)
+    
+    def _search_stream(self, payload: bytes) -> Optional[List[Dict]]:
+        """
+        스트리밍 검색 (/search/combined/stream)
+        
+        Returns:
+            전체 결과 리스트, 스트림 엔드포인트가 없으면 None
+        """
+        request = SESSION.prepare_request(
+            requests.Request('POST', URL_SEARCH_STREAM, data=payload, headers=JSON_HEADERS)
+        )
+        response = SESSION.send(request, stream=True, timeout=(5, 30))
+        
+        with response:
+            if response.status_code == 404:
+                return None
+            if response.status_code != 200:
+                # 검색 오류는 응답 전에 500으로 반환되므로 일괄 조회로 다시 시도하지 않음
+                raise RuntimeError(f"HTTP {response.status_code}")
+            
+            results = self.results
+            batch = []
+            for line in response.iter_lines():
+                if not self.is_running:
+                    break
+                if not line:
+                    continue
+                
+                batch.append(_json_loads(line))
+                if len(batch) >= SEARCH_STREAM_BATCH_SIZE:
+                    results.extend(batch)
+                    self.batch_signal.emit(batch)
+                    batch = []
+            
+            if batch:
+                results.extend(batch)
+                self.batch_signal.emit(batch)
+        
+        return results
+    
+    def _search_once(self, payload: bytes) -> Optional[List[Dict]]:
+        """
+        일괄 검색 (/search/combined)
+        
+        Returns:
+            결과 리스트, 오류 시 None (오류 시그널은 이미 전송됨)
+        """
+        request = SESSION.prepare_request(
+            requests.Request('POST', URL_SEARCH, data=payload, headers=JSON_HEADERS)
+        )
+        response = SESSION.send(request, timeout=30)
+        
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            return data.get('results', [])
+        
+        self.log_signal.emit(f"Error: {response.status_code}")
+        self.status_signal.emit("검색 오류")
+        self.finished_signal.emit([])
+        return None
     
     def stop(self):
         """검색 중지"""
@@ -107,6 +252,8 @@ class IndexingWorker(QThread):
         super().__init__()
         self.paths = paths
         self.is_running = True
+        self._stream_response: Optional[requests.Response] = None
+        self._last_progress = (-1, -1)  # 마지막으로 보낸 (indexed, total)
     
     def run(self):
         """인덱싱 실행"""
@@ -115,38 +262,19 @@ class IndexingWorker(QThread):
             self.log_signal.emit(f"인덱싱 경로: {', '.join(self.paths)}")
             
             # Flask API 호출
-            response = requests.post(
-                f"{API_BASE_URL}/indexing/start",
-                json={'paths': self.paths},
+            response = SESSION.post(
+                URL_IDX_START,
+                data=_json_dumps({'paths': self.paths}),
+                headers=JSON_HEADERS,
                 timeout=5
             )
             
             if response.status_code == 200:
                 self.log_signal.emit("인덱싱이 백그라운드에서 시작되었습니다.")
                 
-                # 상태 폴링
-                while self.is_running:
-                    self.msleep(1000)  # 1초 대기
-                    
-                    status_response = requests.get(
-                        f"{API_BASE_URL}/indexing/status",
-                        timeout=5
-                    )
-                    
-                    if status_response.status_code == 200:
-                        status_data = status_response.json()
-                        stats = status_data.get('stats', {})
-                        is_running = status_data.get('is_running', False)
-                        
-                        total = stats.get('total_files', 0)
-                        indexed = stats.get('indexed_files', 0)
-                        
-                        if total > 0:
-                            self.progress_signal.emit(indexed, total)
-                            self.status_signal.emit(f"인덱싱 중: {indexed}/{total}")
-                        
-                        if not is_running:
-                            break
+                # SSE 스트림 구독 (미지원 백엔드면 상태 폴링으로 대체)
+                if not self._watch_stream():
+                    self._poll_status()
                 
                 self.log_signal.emit("인덱싱 완료!")
                 self.status_signal.emit("인덱싱 완료")
@@ -159,13 +287,108 @@ class IndexingWorker(QThread):
             self.log_signal.emit(f"Error: {str(e)}")
             self.status_signal.emit("인덱싱 실패")
     
+    def _emit_progress(self, indexed: int, total: int):
+        """진행 상황 시그널 전송 (값이 바뀐 경우에만)"""
+        if total > 0 and (indexed, total) != self._last_progress:
+            self._last_progress = (indexed, total)
+            self.progress_signal.emit(indexed, total)
+            self.status_signal.emit(f"인덱싱 중: {indexed}/{total}")
+    
+    def _watch_stream(self) -> bool:
+        """
+        SSE 스트림(/indexing/stream)으로 진행 상황 수신
+        
+        Returns:
+            스트림을 끝까지 처리했으면 True, 스트림을 열 수 없으면 False
+        """
+        try:
+            response = SESSION.get(
+                URL_IDX_STREAM,
+                stream=True,
+                timeout=(5, None)
+            )
+        except requests.RequestException:
+            return False
+        
+        if response.status_code != 200:
+            response.close()
+            return False
+        
+        self._stream_response = response
+        try:
+            # 바이트 그대로 처리 (JSON 파서가 bytes를 직접 디코딩)
+            event = b'message'
+            for line in response.iter_lines():
+                if not self.is_running:
+                    break
+                
+                if not line:
+                    # 빈 줄 = 이벤트 경계
+                    event = b'message'
+                elif line.startswith(b'event:'):
+                    event = line[6:].strip()
+                elif line.startswith(b'data:'):
+                    if event == b'done':
+                        break
+                    if event == b'progress':
+                        data = _json_loads(line[5:])
+                        self._emit_progress(data.get('indexed', 0), data.get('total', 0))
+        except Exception:
+            # stop()에서 응답을 닫으면 iter_lines가 예외로 종료됨
+            if self.is_running:
+                raise
+        finally:
+            self._stream_response = None
+            response.close()
+        
+        return True
+    
+    def _poll_status(self):
+        """상태 폴링 (SSE 미지원 백엔드용)"""
+        # 매 요청마다 같은 GET이므로 한 번만 준비해서 재사용
+        status_request = SESSION.prepare_request(requests.Request('GET', URL_IDX_STATUS))
+        
+        while self.is_running:
+            self.msleep(1000)  # 1초 대기
+            
+            status_response = SESSION.send(status_request, timeout=5)
+            
+            if status_response.status_code == 200:
+                status_data = _json_loads(status_response.content)
+                stats = status_data.get('stats', {})
+                
+                self._emit_progress(stats.get('indexed_files', 0), stats.get('total_files', 0))
+                
+                if not status_data.get('is_running', False):
+                    break
+    
     def stop(self):
         """인덱싱 중지"""
         self.is_running = False
         try:
-            requests.post(f"{API_BASE_URL}/indexing/stop", timeout=5)
+            SESSION.post(URL_IDX_STOP, timeout=5)
         except:
             pass
+        
+        # 스트림 대기 중인 iter_lines 해제
+        response = self._stream_response
+        if response is not None:
+            response.close()
+
+
+class HealthCheckWorker(QThread):
+    """백엔드 연결 확인 Worker Thread (시작 시 UI 스레드 블로킹 방지)"""
+    
+    # Signals
+    finished_signal = pyqtSignal(int)  # HTTP 상태 코드 (연결 실패 시 -1)
+    
+    def run(self):
+        """/health 요청 (공유 세션 사용 - 연결 풀 예열)"""
+        try:
+            response = SESSION.get(URL_HEALTH, timeout=2)
+            self.finished_signal.emit(response.status_code)
+        except Exception:
+            self.finished_signal.emit(-1)
 
 
 class AdvancedExplorerGUI(QMainWindow):
@@ -174,11 +397,45 @@ class AdvancedExplorerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.search_worker: Optional[SearchWorker] = None
+        self.health_worker: Optional[HealthCheckWorker] = None
+        self._stopped_search_workers = set()
         self.indexing_worker: Optional[IndexingWorker] = None
         self.current_directory = "C:\\Users"
         
+        # 검색 결과 배치 렌더링 상태
+        self._pending_results: List[Dict] = []
+        self._render_index = 0
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_next_batch)
+        
+        # 인덱싱 진행 상황 갱신 병합 (최대 초당 10회)
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._apply_indexing_progress)
+        
+        # 검색어 기록 (최근 사용 순, 중복 없음)
+        self._search_history: OrderedDict = OrderedDict()
+        
+        # 인덱싱된 내용 미리보기 LRU 캐시 {(path, mtime): 표시 텍스트}
+        self._content_cache: OrderedDict = OrderedDict()
+        
+        # 로그 링 버퍼 (append마다 다시 그리지 않고 주기적으로 한 번에 반영)
+        self._log_search_lines = deque(maxlen=LOG_MAX_LINES)
+        self._log_indexing_lines = deque(maxlen=LOG_MAX_LINES)
+        self._dirty_logs = set()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        
         self.init_ui()
-        self.check_backend_connection()
+        
+        # 백엔드 연결 확인은 이벤트 루프 시작 후 백그라운드에서 수행
+        QTimer.singleShot(0, self.check_backend_connection)
     
     def init_ui(self):
         """UI 초기화"""
@@ -230,6 +487,8 @@ class AdvancedExplorerGUI(QMainWindow):
         self.cbo_search_keyword = QComboBox()
         self.cbo_search_keyword.setEditable(True)
         self.cbo_search_keyword.setPlaceholderText("검색어 입력...")
+        # 입력값 자동 추가 대신 _add_search_history에서 기록 관리
+        self.cbo_search_keyword.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.cbo_search_keyword.lineEdit().returnPressed.connect(self.on_search)
         layout.addWidget(QLabel("검색:"))
         layout.addWidget(self.cbo_search_keyword, 3)
@@ -297,6 +556,7 @@ class AdvancedExplorerGUI(QMainWindow):
         layout.addWidget(QLabel("📄 파일 리스트"))
         self.tree_file_list = QTreeWidget()
         self.tree_file_list.setHeaderLabels(["이름", "크기", "수정한 날짜", "경로"])
+        self.tree_file_list.setUniformRowHeights(True)  # 행 높이 개별 계산 생략
         self.tree_file_list.itemClicked.connect(self.on_file_clicked)
         
         # 스타일: 수평선 없애고 수직선 점선
@@ -342,7 +602,7 @@ class AdvancedExplorerGUI(QMainWindow):
         
         # 내역 표시
         layout.addWidget(QLabel("📝 내역 보기 및 편집"))
-        self.txt_content_view = QTextEdit()
+        self.txt_content_view = QPlainTextEdit()  # 일반 텍스트 전용 (대용량 내용 레이아웃이 빠름)
         self.txt_content_view.setReadOnly(True)
         layout.addWidget(self.txt_content_view, 1)
         
@@ -360,7 +620,7 @@ class AdvancedExplorerGUI(QMainWindow):
         search_log_layout = QVBoxLayout()
         search_log_widget.setLayout(search_log_layout)
         search_log_layout.addWidget(QLabel("🔍 검색 로그"))
-        self.txt_log_search = QTextEdit()
+        self.txt_log_search = QPlainTextEdit()
         self.txt_log_search.setMaximumHeight(150)
         self.txt_log_search.setReadOnly(True)
         search_log_layout.addWidget(self.txt_log_search)
@@ -371,7 +631,7 @@ class AdvancedExplorerGUI(QMainWindow):
         indexing_log_layout = QVBoxLayout()
         indexing_log_widget.setLayout(indexing_log_layout)
         indexing_log_layout.addWidget(QLabel("📊 인덱싱 로그"))
-        self.txt_log_indexing = QTextEdit()
+        self.txt_log_indexing = QPlainTextEdit()
         self.txt_log_indexing.setMaximumHeight(150)
         self.txt_log_indexing.setReadOnly(True)
         indexing_log_layout.addWidget(self.txt_log_indexing)
@@ -381,7 +641,8 @@ class AdvancedExplorerGUI(QMainWindow):
         
         # 상태 바
         self.lbl_process_status = QLabel("준비")
-        self.lbl_process_status.setStyleSheet("QLabel { padding: 5px; background-color: #f0f0f0; }")
+        self._status_style = None
+        self._set_status_style(STATUS_STYLE_DEFAULT)
         layout.addWidget(self.lbl_process_status)
         
         return layout
@@ -397,10 +658,12 @@ class AdvancedExplorerGUI(QMainWindow):
             ("음악", os.path.join(user_home, "Music"))
         ]
         
+        items = []
         for name, path in favorites:
             item = QTreeWidgetItem([name])
-            item.setData(0, Qt.ItemDataRole.UserRole, path)
-            self.tree_favorites.addTopLevelItem(item)
+            item.setData(0, USER_ROLE, path)
+            items.append(item)
+        self._add_tree_items(self.tree_favorites, items)
     
     def _load_folder_tree(self):
         """폴더 트리 로드"""
@@ -408,26 +671,67 @@ class AdvancedExplorerGUI(QMainWindow):
         import string
         from pathlib import Path
         
-        for drive in string.ascii_uppercase:
+        # Windows: GetLogicalDrives 비트마스크 한 번으로 모든 드라이브 확인
+        drive_mask = None
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                drive_mask = ctypes.WinDLL('kernel32').GetLogicalDrives()
+            except Exception:
+                drive_mask = None
+        
+        items = []
+        for i, drive in enumerate(string.ascii_uppercase):
             drive_path = f"{drive}:\\"
-            if Path(drive_path).exists():
+            if drive_mask is not None:
+                exists = bool(drive_mask & (1 << i))
+            else:
+                exists = Path(drive_path).exists()
+            if exists:
                 item = QTreeWidgetItem([f"로컬 디스크 ({drive}:)"])
-                item.setData(0, Qt.ItemDataRole.UserRole, drive_path)
-                self.tree_folders.addTopLevelItem(item)
+                item.setData(0, USER_ROLE, drive_path)
+                items.append(item)
+        self._add_tree_items(self.tree_folders, items)
+    
+    def _add_tree_items(self, tree: QTreeWidget, items: List[QTreeWidgetItem]):
+        """정렬/화면 갱신을 끈 상태에서 항목을 한 번에 추가 (모델 변경 시그널 1회)"""
+        if not items:
+            return
+        sorting_enabled = tree.isSortingEnabled()
+        tree.setSortingEnabled(False)
+        tree.setUpdatesEnabled(False)
+        # 삽입 중 위젯 시그널 차단 (항목 변경 시그널 억제)
+        blocker = QSignalBlocker(tree)
+        tree.addTopLevelItems(items)
+        blocker.unblock()
+        tree.setUpdatesEnabled(True)
+        tree.setSortingEnabled(sorting_enabled)
     
     def check_backend_connection(self):
-        """백엔드 연결 확인"""
-        try:
-            response = requests.get(f"{API_BASE_URL}/health", timeout=2)
-            if response.status_code == 200:
-                self.lbl_process_status.setText("✅ Python 백엔드 연결됨")
-                self.lbl_process_status.setStyleSheet("QLabel { padding: 5px; background-color: #d4edda; color: #155724; }")
-            else:
-                self.lbl_process_status.setText("⚠️ 백엔드 응답 없음")
-                self.lbl_process_status.setStyleSheet("QLabel { padding: 5px; background-color: #fff3cd; color: #856404; }")
-        except:
+        """백엔드 연결 확인 (비동기)"""
+        if self.health_worker and self.health_worker.isRunning():
+            return
+        self.health_worker = HealthCheckWorker()
+        self.health_worker.finished_signal.connect(self.on_health_checked)
+        self.health_worker.start()
+    
+    def _set_status_style(self, style: str):
+        """상태 표시줄 스타일 변경 (같은 스타일이면 CSS 재파싱 생략)"""
+        if style != self._status_style:
+            self._status_style = style
+            self.lbl_process_status.setStyleSheet(style)
+    
+    def on_health_checked(self, status_code: int):
+        """백엔드 연결 확인 결과 표시"""
+        if status_code == 200:
+            self.lbl_process_status.setText("✅ Python 백엔드 연결됨")
+            self._set_status_style(STATUS_STYLE_OK)
+        elif status_code > 0:
+            self.lbl_process_status.setText("⚠️ 백엔드 응답 없음")
+            self._set_status_style(STATUS_STYLE_WARN)
+        else:
             self.lbl_process_status.setText("❌ Python 백엔드 연결 실패 (http://127.0.0.1:5000)")
-            self.lbl_process_status.setStyleSheet("QLabel { padding: 5px; background-color: #f8d7da; color: #721c24; }")
+            self._set_status_style(STATUS_STYLE_ERROR)
             QMessageBox.warning(self, "연결 오류", "Python 백엔드에 연결할 수 없습니다.\n서버를 시작했는지 확인하세요.")
     
     def on_search(self):
@@ -437,18 +741,45 @@ class AdvancedExplorerGUI(QMainWindow):
             QMessageBox.warning(self, "입력 오류", "검색어를 입력하세요.")
             return
         
+        self._add_search_history(query)
+        
         # 검색 시작
         self.btn_search.setEnabled(False)
         self.btn_stop_search.setEnabled(True)
+        self._render_timer.stop()
+        self._pending_results = []
+        self._render_index = 0
         self.tree_file_list.clear()
         
+        # 이전 검색이 아직 스트리밍 중이면 중지 (스레드 종료 전까지 참조 유지)
+        if self.search_worker and self.search_worker.isRunning():
+            old_worker = self.search_worker
+            old_worker.stop()
+            self._stopped_search_workers.add(old_worker)
+            old_worker.finished.connect(lambda: self._stopped_search_workers.discard(old_worker))
+        
         self.search_worker = SearchWorker(query, self.current_directory)
         self.search_worker.progress_signal.connect(self.on_search_progress)
         self.search_worker.log_signal.connect(self.on_search_log)
         self.search_worker.status_signal.connect(self.on_status_update)
+        self.search_worker.batch_signal.connect(self.on_search_batch)
         self.search_worker.finished_signal.connect(self.on_search_finished)
         self.search_worker.start()
     
+    def _add_search_history(self, query: str):
+        """검색어 기록 갱신 (최근 항목을 맨 위로, 최대 SEARCH_HISTORY_SIZE개)"""
+        self._search_history.pop(query, None)
+        self._search_history[query] = None
+        if len(self._search_history) > SEARCH_HISTORY_SIZE:
+            self._search_history.popitem(last=False)
+        
+        combo = self.cbo_search_keyword
+        blocker = QSignalBlocker(combo)
+        combo.clear()
+        combo.addItems(reversed(self._search_history))
+        combo.setCurrentText(query)
+        blocker.unblock()
+    
     def on_stop_search(self):
         """검색 중지"""
         if self.search_worker:
@@ -463,7 +794,26 @@ class AdvancedExplorerGUI(QMainWindow):
     
     def on_search_log(self, message: str):
         """검색 로그"""
-        self.txt_log_search.append(message)
+        self._queue_log(self._log_search_lines, 'search', message)
+    
+    def _queue_log(self, lines: deque, name: str, message: str):
+        """로그를 버퍼에 넣고 화면 반영 예약"""
+        lines.append(message)
+        self._dirty_logs.add(name)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_logs(self):
+        """버퍼에 쌓인 로그를 로그 창에 한 번에 반영"""
+        for name in self._dirty_logs:
+            if name == 'search':
+                widget, lines = self.txt_log_search, self._log_search_lines
+            else:
+                widget, lines = self.txt_log_indexing, self._log_indexing_lines
+            widget.setPlainText('\n'.join(lines))
+            scroll_bar = widget.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.maximum())
+        self._dirty_logs.clear()
     
     def on_status_update(self, status: str):
         """상태 업데이트"""
@@ -471,23 +821,59 @@ class AdvancedExplorerGUI(QMainWindow):
     
     def on_search_finished(self, results: List[Dict]):
         """검색 완료"""
+        # 중지된 이전 검색의 늦은 시그널은 무시
+        if self.sender() is not self.search_worker:
+            return
+        
         self.btn_search.setEnabled(True)
         self.btn_stop_search.setEnabled(False)
         
-        # 결과 표시
-        for result in results:
-            name = result.get('name', '')
-            size = self._format_size(result.get('size', 0))
-            mtime = result.get('mtime', '')
-            path = result.get('path', '')
-            indexed = "✓" if result.get('indexed', False) else ""
-            
-            item = QTreeWidgetItem([f"{indexed} {name}", size, mtime, path])
-            item.setData(0, Qt.ItemDataRole.UserRole, result)
-            self.tree_file_list.addTopLevelItem(item)
-        
+        # 결과 표시 (배치 단위로 나눠서 추가, UI 멈춤 방지)
+        # 스트리밍으로 이미 추가된 앞부분은 _render_index 이후부터 이어서 추가
+        self._pending_results = results
+        self._render_index = min(self._render_index, len(results))
         self.lbl_total_count.setText(f"Total: {len(results)} files")
         self.progress_bar.setValue(0)
+        if not self._render_timer.isActive():
+            self._render_next_batch()
+    
+    def on_search_batch(self, batch: List[Dict]):
+        """스트리밍 검색 결과 일부 도착 - 대기 목록에 붙이고 렌더링 예약"""
+        if self.sender() is not self.search_worker:
+            return
+        
+        self._pending_results.extend(batch)
+        self.lbl_total_count.setText(f"Total: {len(self._pending_results)} files")
+        if not self._render_timer.isActive():
+            self._render_next_batch()
+    
+    def _render_next_batch(self):
+        """대기 중인 검색 결과를 한 배치만 트리에 추가"""
+        start = self._render_index
+        batch = self._pending_results[start:start + RESULT_RENDER_BATCH_SIZE]
+        if not batch:
+            return
+        
+        # 컬럼별 리스트로 먼저 추출한 뒤 항목 생성 (반복문 내 속성 조회 최소화)
+        format_size = self._format_size
+        labels = [f"{'✓' if r.get('indexed', False) else ''} {r.get('name', '')}" for r in batch]
+        sizes = [format_size(r.get('size', 0)) for r in batch]
+        mtimes = [r.get('mtime', '') for r in batch]
+        paths = [r.get('path', '') for r in batch]
+        
+        items = [
+            QTreeWidgetItem([label, size, mtime, path])
+            for label, size, mtime, path in zip(labels, sizes, mtimes, paths)
+        ]
+        for item, result in zip(items, batch):
+            item.setData(0, USER_ROLE, result)
+        
+        self._add_tree_items(self.tree_file_list, items)
+        
+        self._render_index = start + len(batch)
+        if self._render_index < len(self._pending_results):
+            # 다음 배치는 이벤트 루프를 한 번 돌린 뒤 추가
+            self._render_timer.start()
     
     def on_index_start(self):
         """인덱싱 시작"""
@@ -499,10 +885,10 @@ class AdvancedExplorerGUI(QMainWindow):
         reply = QMessageBox.question(
             self, "인덱싱 확인",
             f"다음 경로를 인덱싱하시겠습니까?\n\n{self.current_directory}",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            MSG_YES | MSG_NO
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == MSG_YES:
             self.btn_index_start.setEnabled(False)
             self.btn_index_stop.setEnabled(True)
             
@@ -521,17 +907,31 @@ class AdvancedExplorerGUI(QMainWindow):
             self.btn_index_stop.setEnabled(False)
     
     def on_indexing_progress(self, current: int, total: int):
-        """인덱싱 진행 상황"""
+        """인덱싱 진행 상황 (100ms 단위로 모아서 화면 갱신)"""
+        self._pending_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _apply_indexing_progress(self):
+        """모아둔 인덱싱 진행 상황을 위젯에 반영"""
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(current)
         self.lbl_total_count.setText(f"Total: {current}/{total} files")
     
     def on_indexing_log(self, message: str):
         """인덱싱 로그"""
-        self.txt_log_indexing.append(message)
+        self._queue_log(self._log_indexing_lines, 'indexing', message)
     
     def on_indexing_finished(self):
         """인덱싱 완료"""
+        # 아직 반영되지 않은 마지막 진행 상황 즉시 반영
+        self._progress_timer.stop()
+        self._apply_indexing_progress()
+        
         self.btn_index_start.setEnabled(True)
         self.btn_index_stop.setEnabled(False)
         self.progress_bar.setValue(0)
@@ -539,25 +939,25 @@ class AdvancedExplorerGUI(QMainWindow):
     
     def on_favorite_clicked(self, item: QTreeWidgetItem, column: int):
         """즐겨찾기 클릭"""
-        path = item.data(0, Qt.ItemDataRole.UserRole)
+        path = item.data(0, USER_ROLE)
         if path:
             self.current_directory = path
             self.lbl_process_status.setText(f"선택: {path}")
     
     def on_folder_clicked(self, item: QTreeWidgetItem, column: int):
         """폴더 트리 클릭"""
-        path = item.data(0, Qt.ItemDataRole.UserRole)
+        path = item.data(0, USER_ROLE)
         if path:
             self.current_directory = path
             self.lbl_process_status.setText(f"선택: {path}")
     
     def on_file_clicked(self, item: QTreeWidgetItem, column: int):
         """파일 리스트 클릭"""
-        result = item.data(0, Qt.ItemDataRole.UserRole)
+        result = item.data(0, USER_ROLE)
         if result:
             # 인덱싱된 파일이면 내용 표시
             if result.get('indexed', False):
-                self._show_indexed_content(result['path'])
+                self._show_indexed_content(result['path'], result.get('mtime'))
             else:
                 # 이미지 파일이면 미리보기
                 ext = result.get('extension', '').lower()
@@ -569,9 +969,9 @@ class AdvancedExplorerGUI(QMainWindow):
     def on_view_indexed(self):
         """인덱싱 DB 내역 보기"""
         try:
-            response = requests.get(f"{API_BASE_URL}/statistics", timeout=5)
+            response = SESSION.get(URL_STATS, timeout=5)
             if response.status_code == 200:
-                stats = response.json()
+                stats = _json_loads(response.content)
                 total = stats.get('total_indexed_files', 0)
                 size = stats.get('database_size', 0)
                 
@@ -583,40 +983,54 @@ class AdvancedExplorerGUI(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "오류", f"DB 통계 조회 실패:\n{str(e)}")
     
-    def _show_indexed_content(self, file_path: str):
-        """인덱싱된 파일 내용 표시"""
+    def _show_indexed_content(self, file_path: str, mtime=None):
+        """인덱싱된 파일 내용 표시 (같은 path/mtime 재조회 시 캐시 사용)"""
+        cache_key = (file_path, mtime)
+        cached = self._content_cache.get(cache_key)
+        if cached is not None:
+            self._content_cache.move_to_end(cache_key)
+            self.txt_content_view.setPlainText(cached)
+            return
+        
         try:
-            response = requests.post(
-                f"{API_BASE_URL}/indexing/indexed-content",
-                json={'path': file_path},
+            response = SESSION.post(
+                URL_INDEXED_CONTENT,
+                data=_json_dumps({'path': file_path, 'max_chars': CONTENT_PREVIEW_CHARS}),
+                headers=JSON_HEADERS,
                 timeout=5
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 if data.get('indexed', False):
                     content = data.get('content', '')
-                    self.txt_content_view.setPlainText(
+                    text = (
                         f"[인덱싱된 파일]\n\n"
                         f"경로: {file_path}\n\n"
-                        f"--- 내용 ---\n\n{content[:5000]}"  # 처음 5000자
+                        f"--- 내용 ---\n\n{content[:CONTENT_PREVIEW_CHARS]}"  # 처음 5000자
                     )
+                    self.txt_content_view.setPlainText(text)
+                    
+                    self._content_cache[cache_key] = text
+                    if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                        self._content_cache.popitem(last=False)
                 else:
                     self.txt_content_view.setPlainText(f"인덱싱되지 않은 파일입니다.")
         except Exception as e:
             self.txt_content_view.setPlainText(f"오류: {str(e)}")
     
-    def _format_size(self, bytes_size: int) -> str:
-        """파일 크기 포맷팅"""
-        if bytes_size == 0:
+    def closeEvent(self, event):
+        """윈도우 종료 시 공유 HTTP 세션 정리"""
+        SESSION.close()
+        super().closeEvent(event)
+    
+    @staticmethod
+    def _format_size(bytes_size: int) -> str:
+        """파일 크기 포맷팅 (bit_length로 단위를 한 번에 계산)"""
+        if bytes_size <= 0:
             return "0 B"
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        i = 0
-        size = float(bytes_size)
-        while size >= 1024 and i < len(units) - 1:
-            size /= 1024
-            i += 1
-        return f"{size:.1f} {units[i]}"
+        i = min((int(bytes_size).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{bytes_size / (1 << (i * 10)):.1f} {SIZE_UNITS[i]}"
 
 
 def main():
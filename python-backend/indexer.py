@@ -5,22 +5,35 @@
 
 import os
 import threading
-from pathlib import Path
-from typing import List, Callable, Optional, Dict
+from typing import List, Callable, Optional, Dict, Set
 import logging
 import time
-from queue import Queue
-from datetime import datetime
+from queue import Queue, Empty
 import traceback
-import signal
-from functools import wraps
+import functools
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, CancelledError as FutureCancelledError, wait as wait_futures, FIRST_COMPLETED
+from collections import deque
+from itertools import islice
 import re
+import codecs
+import fnmatch
 import unicodedata
 import shutil
 import tempfile
+import hashlib
+import mmap
+import zipfile
+import xml.etree.ElementTree as ET
+import importlib
+import importlib.util
 
-# 텍스트 추출 라이브러리
-import chardet  # 인코딩 자동 감지
+# 텍스트 추출 라이브러리 (인코딩 자동 감지: C 확장 cchardet 우선, 없으면 chardet)
+try:
+    import cchardet as chardet_impl
+    CCHARDET_AVAILABLE = True
+except ImportError:
+    import chardet as chardet_impl
+    CCHARDET_AVAILABLE = False
 
 # 사용자 입력 감지 (키보드/마우스)
 try:
@@ -30,48 +43,49 @@ except ImportError:
     PYNPUT_AVAILABLE = False
     logging.warning("pynput not installed. User activity monitoring disabled.")
 
-# 문서 파일 파싱
-try:
-    import docx  # python-docx
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    logging.warning("python-docx not installed. .docx support disabled.")
+# 문서 파일 파싱 (무거운 파서는 설치 여부만 확인하고, 실제 import는 해당 형식을 처음 추출할 때 수행)
+def _module_available(name: str) -> bool:
+    """모듈을 import하지 않고 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    from pptx import Presentation  # python-pptx
-    PPTX_AVAILABLE = True
-except ImportError:
-    PPTX_AVAILABLE = False
-    logging.warning("python-pptx not installed. .pptx support disabled.")
 
-try:
-    import fitz  # PyMuPDF
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+_lazy_modules: Dict[str, object] = {}
+_lazy_modules_lock = threading.Lock()
+
+
+def _lazy_import(name: str):
+    """파서 모듈 지연 import (처음 호출 시 한 번만 로드, 스레드 안전)"""
+    module = _lazy_modules.get(name)
+    if module is None:
+        with _lazy_modules_lock:
+            module = _lazy_modules.get(name)
+            if module is None:
+                module = importlib.import_module(name)
+                _lazy_modules[name] = module
+    return module
+
+
+DOCX_AVAILABLE = _module_available('docx')  # python-docx (본문 파트 이름이 비표준인 .docx 처리용)
+if not DOCX_AVAILABLE:
+    logging.warning("python-docx not installed. Non-standard .docx fallback disabled.")
+
+PDF_AVAILABLE = _module_available('fitz')  # PyMuPDF
+if not PDF_AVAILABLE:
     logging.warning("PyMuPDF not installed. .pdf support disabled.")
 
-try:
-    import openpyxl
-    XLSX_AVAILABLE = True
-except ImportError:
-    XLSX_AVAILABLE = False
+XLSX_AVAILABLE = _module_available('openpyxl')
+if not XLSX_AVAILABLE:
     logging.warning("openpyxl not installed. .xlsx support disabled.")
 
-try:
-    import win32com.client
-    import pythoncom
-    WIN32COM_AVAILABLE = True
-except ImportError:
-    WIN32COM_AVAILABLE = False
+WIN32COM_AVAILABLE = _module_available('win32com') and _module_available('pythoncom')
+if not WIN32COM_AVAILABLE:
     logging.warning("pywin32 not installed. .doc, .ppt, .xls, .hwp support disabled.")
 
-try:
-    import olefile
-    OLEFILE_AVAILABLE = True
-except ImportError:
-    OLEFILE_AVAILABLE = False
+OLEFILE_AVAILABLE = _module_available('olefile')
+if not OLEFILE_AVAILABLE:
     logging.warning("olefile not installed. Alternative .hwp support disabled.")
 
 from database import DatabaseManager
@@ -82,12 +96,16 @@ import io
 # UTF-8 전역 설정 (최우선 실행)
 # ========================================
 # Windows 콘솔 코드 페이지를 UTF-8로 설정
+# 대화형 콘솔에서만 적용하고, 이미 UTF-8이면 다시 설정하지 않음
 if sys.platform == 'win32':
     try:
-        import ctypes
-        kernel32 = ctypes.windll.kernel32
-        kernel32.SetConsoleCP(65001)
-        kernel32.SetConsoleOutputCP(65001)
+        if sys.stdout is not None and sys.stdout.isatty():
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if kernel32.GetConsoleCP() != 65001:
+                kernel32.SetConsoleCP(65001)
+            if kernel32.GetConsoleOutputCP() != 65001:
+                kernel32.SetConsoleOutputCP(65001)
     except Exception:
         pass
 
@@ -130,7 +148,49 @@ logger = logging.getLogger(__name__)
 
 # 상수 정의
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+ENCODING_DETECT_SAMPLE = 64 * 1024  # 인코딩 감지에 사용할 앞부분 크기 (64KB)
+LOG_FLUSH_INTERVAL = 0.5  # 로그 파일 flush 주기 (초)
+LOG_FLUSH_LINES = 64  # 이 개수만큼 쌓이면 주기와 관계없이 flush
+ENCODING_CACHE_SIZE = 1024  # (확장자, 폴더)별 감지 인코딩 캐시 최대 개수
+ENCODING_CACHE_MIN_CONFIDENCE = 0.7  # 이 신뢰도 이상인 chardet 결과만 캐시
 PARSE_TIMEOUT = 60  # 60초
+MAX_TEXT_LENGTH = 100000  # 파일당 인덱싱할 최대 텍스트 길이 (100KB) - 도달하면 추출 중단
+TEXT_COPY_BYTES = MAX_TEXT_LENGTH * 4 + 4  # 텍스트 파일 읽기 / CSV 임시 복사 크기 (문자당 최대 4바이트 + 잘린 문자 여유분)
+EXTRACT_WORKERS = min(os.cpu_count() or 1, 8)  # 텍스트 추출 병렬 스레드 수
+COLLECT_WORKERS = 4  # 파일 수집(디렉토리 읽기) 병렬 스레드 수
+COLLECT_BATCH_DIRS = 32  # 수집 작업 하나가 연속으로 읽을 최대 디렉토리 수
+COM_EXTRACT_WORKERS = 2  # Office/한글 COM 추출 병렬 스레드 수 (스레드마다 Office 프로세스가 뜨므로 적게 유지)
+COM_EXTENSIONS = frozenset({'.doc', '.ppt', '.xls', '.hwp'})  # COM 추출 풀에서 처리할 확장자
+COM_APP_MAX_USES = 200  # Office COM 인스턴스 하나로 처리할 최대 문서 수 (초과 시 새 인스턴스로 교체)
+EXTRACT_MAX_IN_FLIGHT = 32  # 추출 중/대기 중인 파일 상한 (메모리 사용 제한)
+COM_MAX_IN_FLIGHT = COM_EXTRACT_WORKERS * 4  # COM 추출 중/대기 중인 파일 상한
+RETRY_SAVE_BATCH_SIZE = 50  # 재시도 성공 파일을 이 개수만큼 모아서 한 번에 커밋
+RETRY_DEGRADED_THRESHOLD = 3  # 이 횟수 이상 재시도에 실패한 Office 문서는 문서 속성만 인덱싱
+MINIMAL_EXTRACT_EXTENSIONS = frozenset({'.docx', '.pptx', '.xlsx'})  # 문서 속성(docProps/core.xml)을 읽을 수 있는 확장자
+DOC_PROPERTY_FIELDS = ('title', 'subject', 'creator', 'keywords', 'description', 'category', 'lastModifiedBy')
+HASH_CHUNK_SIZE = 1024 * 1024  # 내용 해시 계산 시 한 번에 읽을 크기 (1MB)
+DB_WRITE_QUEUE_SIZE = 4  # DB 기록 스레드에 넘길 수 있는 대기 작업 수 (초과 시 추출 결과 반영이 기다림)
+DB_WRITE_COALESCE_FILES = 500  # DB 기록 스레드가 한 트랜잭션으로 합칠 최대 파일 수
+
+# 토큰 패턴: CJK 문자(한글, 중국어, 일본어)는 한 글자씩, 그 외는 공백 기준 단어
+# - 한글: \uAC00-\uD7AF (가-힣), \u1100-\u11FF, \u3130-\u318F
+# - 중국어: \u4E00-\u9FFF
+# - 일본어: \u3040-\u309F (히라가나), \u30A0-\u30FF (가타카나)
+_CJK_CHARS = r'\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F\u4E00-\u9FFF\u3040-\u309F\u30A0-\u30FF'
+TOKEN_PATTERN = re.compile(rf'[{_CJK_CHARS}]|[^\s{_CJK_CHARS}]+')
+
+# Office Open XML 네임스페이스 (docx/pptx 본문 XML 직접 파싱용)
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DRAWING_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+
+# 텍스트 파일 BOM → 인코딩 (UTF-32 LE BOM이 UTF-16 LE BOM으로 시작하므로 UTF-32를 먼저 확인)
+TEXT_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
 
 
 class TimeoutError(Exception):
@@ -138,39 +198,34 @@ class TimeoutError(Exception):
     pass
 
 
-def timeout_handler(signum, frame):
-    """타임아웃 시그널 핸들러"""
-    raise TimeoutError("Parsing timeout")
+class ExtractionCancelEvent(threading.Event):
+    """
+    추출 작업 취소 이벤트
+    
+    작업이 풀 스레드에서 실행을 시작한 시각과, 풀이 교체되면 새 풀에 다시 제출할 수 있도록
+    제출한 풀과 작업 내용도 함께 보관합니다.
+    """
+    
+    def __init__(self, pool: ThreadPoolExecutor):
+        super().__init__()
+        self.started_at: Optional[float] = None  # time.monotonic() 기준, 대기열에 있으면 None
+        self.pool = pool  # 작업을 제출한 스레드 풀
+        self.task: Optional[Callable[[], object]] = None  # 풀에 제출할 작업 (인자 없는 호출)
 
 
-def with_timeout(seconds):
-    """타임아웃 데코레이터 (Windows에서는 제한적)"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Windows에서는 signal.alarm이 작동하지 않으므로 threading 사용
-            result = [TimeoutError("Timeout")]
-            
-            def target():
-                try:
-                    result[0] = func(*args, **kwargs)
-                except Exception as e:
-                    result[0] = e
-            
-            thread = threading.Thread(target=target, daemon=True)
-            thread.start()
-            thread.join(timeout=seconds)
-            
-            if thread.is_alive():
-                # 타임아웃 발생
-                raise TimeoutError(f"Function execution exceeded {seconds} seconds")
-            
-            if isinstance(result[0], Exception):
-                raise result[0]
-            
-            return result[0]
-        return wrapper
-    return decorator
+def _format_timestamp(include_date: bool = True) -> str:
+    """
+    현재 시각 문자열 (로그용)
+    
+    datetime 객체 생성과 strftime 없이 localtime 필드로 직접 포맷합니다.
+    
+    Returns:
+        'YYYY-MM-DD HH:MM:SS' 또는 'HH:MM:SS' (include_date=False)
+    """
+    lt = time.localtime()
+    if include_date:
+        return f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} {lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
 
 
 class UserActivityMonitor:
@@ -304,6 +359,8 @@ class FileIndexer:
         '.next', '.nuxt', '.cache', '.temp', '.tmp',
         'vendor', 'packages', 'bower_components'
     }
+    # 소문자로 정규화한 제외 폴더 집합 (대소문자 섞인 항목이 추가되어도 매칭되도록)
+    _EXCLUDED_DIRS_LOWER = frozenset(dirname.lower() for dirname in EXCLUDED_DIRS)
     
     # 제외할 파일 패턴 (정확한 이름 매칭)
     EXCLUDED_FILES = {
@@ -325,6 +382,10 @@ class FileIndexer:
         '.ttf', '.otf', '.woff', '.woff2', '.eot'
     }
     
+    # 확장자 매칭용 튜플 (str.endswith는 튜플을 C 레벨에서 한 번에 검사)
+    _EXCLUDED_EXT_SUFFIXES = tuple(EXCLUDED_EXTENSIONS)
+    _SUPPORTED_EXT_SUFFIXES = tuple(SUPPORTED_TEXT_EXTENSIONS | SUPPORTED_DOC_EXTENSIONS)
+    
     # 제외할 경로 접두사 (대소문자 구분 없음)
     EXCLUDED_PATH_PREFIXES = [
         'C:\\Windows',
@@ -339,6 +400,11 @@ class FileIndexer:
         'C:\\swapfile.sys'
     ]
     
+    # 소문자로 미리 변환한 접두사 튜플 (검사마다 lower() 호출 및 루프 제거)
+    _EXCLUDED_PATH_PREFIXES_LOWER = tuple(prefix.lower() for prefix in EXCLUDED_PATH_PREFIXES)
+    # 접두사 검사는 경로 앞부분만 소문자로 변환하면 충분 (긴 경로 전체 변환 방지)
+    _EXCLUDED_PATH_PREFIX_MAX_LEN = max(len(prefix) for prefix in EXCLUDED_PATH_PREFIXES)
+    
     def __init__(self, db_manager: DatabaseManager, log_dir: str = None, enable_activity_monitor: bool = True):
         """
         파일 인덱서 초기화
@@ -368,12 +434,19 @@ class FileIndexer:
         self.indexing_log_file = os.path.join(self.log_dir, 'indexing_log.txt')  # 통합 인덱싱 로그
         self.indexed_file = os.path.join(self.log_dir, 'Indexed.txt')  # 성공한 인덱싱 결과
         
+        # 로그 파일 기록 큐 (기록마다 open/write/close 하지 않고 전용 스레드가 파일을 열어둔 채 모아서 기록)
+        self._log_write_queue: Queue = Queue()
+        self._log_writer_thread = threading.Thread(target=self._log_writer_worker, name='log-writer', daemon=True)
+        self._log_writer_thread.start()
+        
         # 사용자 정의 제외 패턴
         self.custom_excluded_patterns: List[str] = []
+        self._custom_pattern_regex = None  # 패턴 전체를 하나로 컴파일한 정규식 (패턴 변경 시 갱신)
         
         # Skip된 파일 목록 (재시도용)
         self.skipped_files: Dict[str, Dict[str, any]] = {}  # {path: {reason, time, retry_count}}
         self.skipped_files_lock = threading.Lock()
+        self.max_skipped_files = 10000  # 메모리 상한 (초과 시 가장 오래된 항목부터 제거)
         
         # 재시도 스레드
         self.retry_thread: Optional[threading.Thread] = None
@@ -388,20 +461,42 @@ class FileIndexer:
         self.is_auto_indexing_enabled = False
         
         # 인덱싱 로그 (메모리, 최근 500개)
-        self.indexing_logs: List[Dict[str, str]] = []
-        self.indexing_logs_lock = threading.Lock()
         self.max_logs = 500
+        self.indexing_logs: deque = deque(maxlen=self.max_logs)  # 최신 로그가 앞, 초과 시 오래된 로그 자동 제거
+        self.indexing_logs_lock = threading.Lock()
         
         # 사용자 활동 모니터링 (키보드/마우스 입력 감지)
         self.activity_monitor = UserActivityMonitor(idle_threshold=2.0) if enable_activity_monitor else None
         self.enable_activity_monitor = enable_activity_monitor
         self.paused_count = 0  # 일시정지된 횟수 (통계용)
         
+        # chardet으로 감지한 인코딩 캐시 {확장자|폴더: 인코딩} (같은 폴더의 같은 종류 파일은 인코딩이 같은 경우가 많음)
+        self._encoding_cache: Dict[str, str] = {}
+        self._encoding_cache_lock = threading.Lock()
+        
+        # 재시도 워커가 내용을 다시 저장한 파일 (진행 중인 인덱싱의 내용 해시 매칭에서 제외)
+        self._retry_saved_paths: Set[str] = set()
+        self._retry_saved_lock = threading.Lock()
+        
+        # 확장자별 텍스트 추출 함수 (라이브러리 사용 가능 여부는 생성 시 한 번만 확인)
+        self._extractors: Dict[str, Callable[[str], Optional[str]]] = self._build_extractors()
+        
+        # 텍스트 추출 스레드 풀 (파일마다 스레드를 만들지 않고 재사용, 인덱싱/재시도 공용)
+        self._parse_pool = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix='extract')
+        # COM 추출 전용 스레드 풀 (Office 인스턴스 수를 제한, 라이브러리 추출과 별도로 진행)
+        self._com_pool = ThreadPoolExecutor(max_workers=COM_EXTRACT_WORKERS, thread_name_prefix='extract-com')
+        self._com_pool_lock = threading.Lock()  # COM 호출이 멈춘 풀을 교체할 때 사용
+        # 추출 스레드별 취소 이벤트 (타임아웃/중지 시 페이지·행 단위로 추출 중단)
+        self._extract_local = threading.local()
+        # 추출 스레드별 Office COM 인스턴스 (파일마다 DispatchEx/Quit 하지 않고 재사용)
+        self._com_local = threading.local()
+        
         # 통계
         self.stats = {
             'total_files': 0,
             'indexed_files': 0,
             'skipped_files': 0,
+            'unchanged_files': 0,  # 변경 없음으로 건너뛴 파일 (skipped_files에 포함, 캐시 적중률 확인용)
             'error_files': 0,
             'new_files': 0,
             'modified_files': 0,
@@ -420,19 +515,39 @@ class FileIndexer:
         """
         if pattern and pattern not in self.custom_excluded_patterns:
             self.custom_excluded_patterns.append(pattern)
+            self._compile_exclusion_patterns()
             logger.info(f"제외 패턴 추가: {pattern}")
     
     def remove_exclusion_pattern(self, pattern: str):
         """사용자 정의 제외 패턴 제거"""
         if pattern in self.custom_excluded_patterns:
             self.custom_excluded_patterns.remove(pattern)
+            self._compile_exclusion_patterns()
             logger.info(f"제외 패턴 제거: {pattern}")
     
     def clear_exclusion_patterns(self):
         """모든 사용자 정의 제외 패턴 제거"""
         self.custom_excluded_patterns = []
+        self._compile_exclusion_patterns()
         logger.info("모든 사용자 정의 제외 패턴 제거")
     
+    def _compile_exclusion_patterns(self):
+        """
+        사용자 정의 제외 패턴을 하나의 정규식으로 컴파일
+        
+        파일마다 fnmatch를 패턴 수만큼 호출하지 않고 match 한 번으로 검사합니다.
+        (대소문자 무시, fnmatch와 동일하게 normcase 적용)
+        """
+        if not self.custom_excluded_patterns:
+            self._custom_pattern_regex = None
+            return
+        
+        combined = '|'.join(
+            fnmatch.translate(os.path.normcase(pattern.lower()))
+            for pattern in self.custom_excluded_patterns
+        )
+        self._custom_pattern_regex = re.compile(combined)
+    
     def get_exclusion_patterns(self) -> List[str]:
         """사용자 정의 제외 패턴 조회"""
         return self.custom_excluded_patterns.copy()
@@ -461,6 +576,9 @@ class FileIndexer:
         self.status_callback = status_callback
         self.stop_flag.clear()
         
+        # 쓰레드 시작 전에 실행 상태 표시 (시작 직후 상태 조회 시 완료로 오인 방지)
+        self.is_running = True
+        
         # Worker 쓰레드에서 실행
         self.current_thread = threading.Thread(
             target=self._indexing_worker,
@@ -470,6 +588,62 @@ class FileIndexer:
         self.current_thread.start()
         return True
     
+    def _log_writer_worker(self):
+        """
+        로그 파일 기록 워커 (백그라운드 쓰레드)
+        
+        큐에 쌓인 (파일 경로, 내용)을 파일을 열어둔 채 기록하고,
+        LOG_FLUSH_INTERVAL초 동안 새 기록이 없거나 LOG_FLUSH_LINES개가 쌓이면 flush합니다.
+        None을 받으면 남은 내용을 flush하고 종료합니다.
+        """
+        handles = {}
+        unflushed = 0
+        
+        try:
+            while True:
+                try:
+                    item = self._log_write_queue.get(timeout=LOG_FLUSH_INTERVAL)
+                except Empty:
+                    item = ()  # 유휴 상태: 모인 내용 flush
+                
+                if item is None:
+                    break
+                
+                if item:
+                    file_path, text = item
+                    try:
+                        f = handles.get(file_path)
+                        if f is None:
+                            f = handles[file_path] = open(file_path, 'a', encoding='utf-8')
+                        f.write(text)
+                        unflushed += 1
+                    except Exception as e:
+                        logger.error(f"로그 파일 기록 오류 [{file_path}]: {e}")
+                    
+                    if unflushed < LOG_FLUSH_LINES:
+                        continue
+                
+                if unflushed:
+                    for f in handles.values():
+                        try:
+                            f.flush()
+                        except Exception as e:
+                            logger.error(f"로그 파일 flush 오류: {e}")
+                    unflushed = 0
+        
+        finally:
+            for f in handles.values():
+                try:
+                    f.close()
+                except Exception:
+                    pass
+    
+    def _stop_log_writer(self, timeout: float = 2.0):
+        """로그 기록 워커 종료 (남은 로그 flush 후 파일 닫기)"""
+        if self._log_writer_thread.is_alive():
+            self._log_write_queue.put(None)
+            self._log_writer_thread.join(timeout=timeout)
+    
     def _write_indexing_log(self, status: str, path: str, detail: str):
         """
         통합 인덱싱 로그 기록 (indexing_log.txt)
@@ -482,11 +656,10 @@ class FileIndexer:
             detail: 상세 정보
         """
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = _format_timestamp()
             log_line = f"[{timestamp}] {status:15s} | {path} | {detail}\n"
             
-            with open(self.indexing_log_file, 'a', encoding='utf-8') as f:
-                f.write(log_line)
+            self._log_write_queue.put((self.indexing_log_file, log_line))
         
         except Exception as e:
             logger.error(f"통합 로그 기록 오류: {e}")
@@ -513,7 +686,7 @@ class FileIndexer:
             content: 인덱스된 텍스트 내용 (선택사항)
         """
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = _format_timestamp()
             directory = os.path.dirname(path)
             filename = os.path.basename(path)
             
@@ -537,8 +710,7 @@ class FileIndexer:
             
             log_entry += f"{'='*80}\n"
             
-            with open(self.indexed_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            self._log_write_queue.put((self.indexed_file, log_entry))
         
         except Exception as e:
             logger.error(f"Indexed.txt 기록 오류: {e}")
@@ -550,11 +722,10 @@ class FileIndexer:
         Format: [Timestamp] Path : Reason
         """
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = _format_timestamp()
             log_line = f"[{timestamp}] {path} : {reason}\n"
             
-            with open(self.skipcheck_file, 'a', encoding='utf-8') as f:
-                f.write(log_line)
+            self._log_write_queue.put((self.skipcheck_file, log_line))
             
             # 통합 로그에도 기록
             self._write_indexing_log('Skip', path, reason)
@@ -567,13 +738,7 @@ class FileIndexer:
             ]
             
             if any(retryable in reason for retryable in retryable_reasons):
-                with self.skipped_files_lock:
-                    if path not in self.skipped_files:
-                        self.skipped_files[path] = {
-                            'reason': reason,
-                            'time': time.time(),
-                            'retry_count': 0
-                        }
+                self._add_to_retry_queue(path, reason)
             
             # 메모리에 로그 추가
             self._add_log_to_memory('Skip', path, reason)
@@ -592,14 +757,13 @@ class FileIndexer:
         트레이스백 포함
         """
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = _format_timestamp()
             error_msg = f"\n[{timestamp}] {path}\n"
             error_msg += f"Error: {str(error)}\n"
             error_msg += f"Traceback:\n{traceback.format_exc()}\n"
             error_msg += "=" * 80 + "\n"
             
-            with open(self.error_file, 'a', encoding='utf-8') as f:
-                f.write(error_msg)
+            self._log_write_queue.put((self.error_file, error_msg))
             
             # 통합 로그에도 기록
             self._write_indexing_log('Error', path, f"Error: {str(error)}")
@@ -625,16 +789,13 @@ class FileIndexer:
         """
         with self.indexing_logs_lock:
             log_entry = {
-                'time': datetime.now().strftime('%H:%M:%S'),
+                'time': _format_timestamp(include_date=False),
                 'status': status,
                 'path': path,  # 전체 경로 저장
                 'filename': os.path.basename(path),  # 파일명도 별도로 저장
                 'detail': detail
             }
-            self.indexing_logs.insert(0, log_entry)  # 최신 로그를 앞에
-            # 최대 개수 유지
-            if len(self.indexing_logs) > self.max_logs:
-                self.indexing_logs = self.indexing_logs[:self.max_logs]
+            self.indexing_logs.appendleft(log_entry)  # 최신 로그를 앞에 (maxlen 초과분은 deque가 제거)
     
     def get_recent_logs(self, count: int = 100) -> List[Dict[str, str]]:
         """
@@ -647,12 +808,12 @@ class FileIndexer:
             로그 리스트
         """
         with self.indexing_logs_lock:
-            return self.indexing_logs[:count]
+            return list(islice(self.indexing_logs, max(count, 0)))
     
     def clear_logs(self):
         """로그 초기화"""
         with self.indexing_logs_lock:
-            self.indexing_logs = []
+            self.indexing_logs.clear()
     
     def _add_to_retry_queue(self, file_path: str, reason: str):
         """
@@ -664,6 +825,12 @@ class FileIndexer:
         """
         with self.skipped_files_lock:
             if file_path not in self.skipped_files:
+                # 상한 초과 시 가장 먼저 추가된 항목 제거 (dict는 삽입 순서 유지)
+                while len(self.skipped_files) >= self.max_skipped_files:
+                    oldest_path = next(iter(self.skipped_files))
+                    del self.skipped_files[oldest_path]
+                    logger.warning(f"재시도 큐 상한 초과로 제거: {oldest_path}")
+                
                 self.skipped_files[file_path] = {
                     'reason': reason,
                     'time': time.time(),
@@ -671,6 +838,43 @@ class FileIndexer:
                 }
                 logger.info(f"재시도 큐 추가: {file_path} (사유: {reason})")
     
+    def _save_retry_queue(self):
+        """재시도 큐를 DB에 저장 (프로세스 재시작 후 resume_retry_queue로 복원)"""
+        if self.db is None:
+            return
+        
+        with self.skipped_files_lock:
+            entries = [(path, info['reason'], info['retry_count'], info['time'])
+                       for path, info in self.skipped_files.items()]
+        
+        self.db.save_skipped_files(entries)
+    
+    def resume_retry_queue(self):
+        """
+        DB에 저장된 재시도 큐 복원 후 재시도 워커 시작 (프로그램 시작 시 호출)
+        
+        디렉토리를 다시 탐색하지 않고 이전 실행에서 Skip된 파일부터 재시도합니다.
+        """
+        if self.db is None:
+            return
+        
+        entries = self.db.get_skipped_files()
+        if not entries:
+            return
+        
+        with self.skipped_files_lock:
+            for path, reason, retry_count, added_at in entries:
+                if path not in self.skipped_files and len(self.skipped_files) < self.max_skipped_files:
+                    self.skipped_files[path] = {
+                        'reason': reason,
+                        'time': added_at,
+                        'retry_count': retry_count
+                    }
+            restored = len(self.skipped_files)
+        
+        logger.info(f"재시도 큐 복원: {restored}개")
+        self.start_retry_worker()
+    
     def _count_tokens(self, text: str) -> int:
         """
         텍스트의 토큰(단어) 수 계산 (다국어 지원)
@@ -687,31 +891,8 @@ class FileIndexer:
         if not text:
             return 0
         
-        token_count = 0
-        
-        # CJK 문자 패턴 (한글, 중국어, 일본어)
-        # - 한글: \uAC00-\uD7AF (가-힣), \u1100-\u11FF, \u3130-\u318F
-        # - 중국어: \u4E00-\u9FFF
-        # - 일본어: \u3040-\u309F (히라가나), \u30A0-\u30FF (가타카나)
-        cjk_pattern = re.compile(r'[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F\u4E00-\u9FFF\u3040-\u309F\u30A0-\u30FF]')
-        
-        # 텍스트를 CJK 문자와 비CJK 부분으로 분리
-        parts = re.split(r'([\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F\u4E00-\u9FFF\u3040-\u309F\u30A0-\u30FF]+)', text)
-        
-        for part in parts:
-            if not part.strip():
-                continue
-            
-            # CJK 문자인 경우 각 문자를 1토큰으로
-            if cjk_pattern.search(part):
-                # 공백 제거 후 문자 수 계산
-                token_count += len(part.strip())
-            else:
-                # 영어 등 공백 기반 언어는 단어 수로 계산
-                words = part.split()
-                token_count += len(words)
-        
-        return token_count
+        # CJK 문자 하나 또는 CJK/공백이 아닌 문자열(단어) 하나가 토큰 하나 (정규식 한 번으로 계산)
+        return len(TOKEN_PATTERN.findall(text))
     
     def _log_success(self, path: str, char_count: int, token_count: int = 0, db_saved: bool = True, content: str = None):
         """
@@ -944,42 +1125,8 @@ class FileIndexer:
         Returns:
             True면 중지 요청됨, False면 정상 대기 완료
         """
-        elapsed = 0
-        check_interval = 1  # 1초마다 체크
-        
-        while elapsed < seconds:
-            if self.auto_indexing_stop_flag.is_set():
-                return True
-            time.sleep(min(check_interval, seconds - elapsed))
-            elapsed += check_interval
-        
-        return False
-    
-    def _cleanup_deleted_files(self):
-        """DB에서 삭제된 파일 제거"""
-        try:
-            logger.info("🗑️ 삭제된 파일 정리 시작...")
-            
-            # DB에서 모든 인덱싱된 파일 경로 가져오기
-            indexed_files = self.db.get_all_indexed_file_paths()
-            
-            deleted_count = 0
-            for file_path in indexed_files:
-                # 파일이 실제로 존재하는지 확인
-                if not os.path.exists(file_path):
-                    logger.info(f"🗑️ 삭제된 파일 제거: {file_path}")
-                    self.db.delete_file(file_path)
-                    deleted_count += 1
-            
-            if deleted_count > 0:
-                logger.info(f"✅ 삭제된 파일 {deleted_count}개 제거 완료")
-                self.stats['deleted_files'] += deleted_count
-            else:
-                logger.debug("✅ 삭제된 파일 없음")
-        
-        except Exception as e:
-            logger.error(f"삭제된 파일 정리 오류: {e}")
-            logger.error(traceback.format_exc())
+        # 주기적으로 깨어나지 않고 중지 요청(set) 또는 시간 초과까지 블록
+        return self.auto_indexing_stop_flag.wait(timeout=seconds)
     
     def cleanup(self):
         """인덱서 리소스 정리 및 Lock 해제 - 강화된 종료 보장"""
@@ -1037,8 +1184,17 @@ class FileIndexer:
                 else:
                     logger.info("  ✓ 메인 인덱싱 스레드 종료 완료")
             
-            # 4단계: 메모리 정리
+            # 3단계-2: 추출 스레드의 Office COM 인스턴스 종료 후 스레드 풀 종료 (실행 중인 추출은 기다리지 않음)
+            self._release_com_apps_in_pool()
+            self._com_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            
+            # 3단계-3: 로그 기록 워커 종료 (남은 로그 파일 기록)
+            self._stop_log_writer()
+            
+            # 4단계: 메모리 정리 (재시도 큐는 다음 실행을 위해 DB에 저장 후 비움)
             logger.info("4단계: 메모리 정리...")
+            self._save_retry_queue()
             with self.skipped_files_lock:
                 self.skipped_files.clear()
             
@@ -1068,6 +1224,7 @@ class FileIndexer:
             'total_files': 0,
             'indexed_files': 0,
             'skipped_files': 0,
+            'unchanged_files': 0,  # 변경 없음으로 건너뛴 파일 (skipped_files에 포함, 캐시 적중률 확인용)
             'error_files': 0,
             'new_files': 0,
             'modified_files': 0,
@@ -1086,24 +1243,35 @@ class FileIndexer:
         self._update_status("파일 수집 중...")
         
         try:
-            # 1단계: 파일 목록 수집
+            # 1단계: 파일 목록 수집 (루트 경로별로 병렬 크롤링)
             all_files = []
-            for root_path in root_paths:
-                if self.stop_flag.is_set():
-                    break
-                all_files.extend(self._collect_files(root_path))
+            file_stats = {}  # {경로: stat 결과} - 수집 시 얻은 stat을 증분 처리에서 재사용
+            if len(root_paths) > 1:
+                max_workers = min(len(root_paths), os.cpu_count() or 4)
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collect') as executor:
+                    # map은 입력 순서를 유지하므로 결과 순서가 순차 수집과 동일
+                    for files in executor.map(lambda root: self._collect_files(root, file_stats), root_paths):
+                        all_files.extend(files)
+            else:
+                for root_path in root_paths:
+                    if self.stop_flag.is_set():
+                        break
+                    all_files.extend(self._collect_files(root_path, file_stats))
             
             self.stats['total_files'] = len(all_files)
             logger.info(f"수집된 파일: {len(all_files)}개")
             self._update_status(f"총 {len(all_files)}개 파일 발견")
             
+            # 인덱싱된 파일의 mtime을 한 번에 조회 (파일마다 DB 조회 방지, 삭제 파일 정리에도 재사용)
+            indexed_mtimes = self.db.get_all_indexed_mtimes()
+            
             # 2단계: 증분 인덱싱 (New/Modified 파일만)
             self._update_status("증분 인덱싱 중...")
-            self._process_files_incremental(all_files)
+            self._process_files_incremental(all_files, indexed_mtimes, file_stats)
             
             # 3단계: 삭제된 파일 정리
             self._update_status("삭제된 파일 정리 중...")
-            self._cleanup_deleted_files(all_files)
+            self._cleanup_deleted_files(all_files, list(indexed_mtimes))
             
             # 4단계: DB 최적화 (VACUUM)
             self._update_status("데이터베이스 최적화 중...")
@@ -1130,95 +1298,319 @@ class FileIndexer:
             self.stats['end_time'] = time.time()
             elapsed = self.stats['end_time'] - self.stats['start_time']
             summary = f"완료: {self.stats['indexed_files']}개 인덱싱 ({elapsed:.2f}초)"
+            if self.stats['unchanged_files'] > 0:
+                summary += f" | 변경 없음 {self.stats['unchanged_files']}개"
             if self.stats['paused_count'] > 0:
                 summary += f" | 일시정지 {self.stats['paused_count']}회"
             logger.info(summary)
             self._update_status(summary)
             self.is_running = False
             
-            # 재시도 워커 시작 (Skip된 파일이 있는 경우)
+            # 재시도 큐 저장 후 재시도 워커 시작 (Skip된 파일이 있는 경우)
+            self._save_retry_queue()
             with self.skipped_files_lock:
                 if self.skipped_files:
                     logger.info(f"재시도 워커 시작: Skip된 파일 {len(self.skipped_files)}개")
                     self.start_retry_worker()
     
-    def _process_files_incremental(self, all_files: List[str]):
-        """증분 파일 처리 (New/Modified만) - 리소스 사용 최소화"""
+    def _process_files_incremental(self, all_files: List[str], indexed_mtimes: Optional[Dict[str, float]] = None,
+                                   file_stats: Optional[Dict[str, os.stat_result]] = None):
+        """
+        증분 파일 처리 (New/Modified만) - 리소스 사용 최소화
+        
+        Args:
+            all_files: 수집된 파일 경로 리스트
+            indexed_mtimes: {경로: mtime} 인덱싱된 파일 정보 (없으면 DB에서 일괄 조회)
+            file_stats: {경로: stat 결과} 수집 단계에서 얻은 stat (없는 파일만 다시 stat)
+        """
+        if file_stats is None:
+            file_stats = {}
+        
+        if indexed_mtimes is None:
+            indexed_mtimes = self.db.get_all_indexed_mtimes()
+        
+        # 이전에 재시도 저장된 파일은 DB 해시가 이미 지워졌으므로 아래에서 읽는 값에 반영됨
+        with self._retry_saved_lock:
+            self._retry_saved_paths.clear()
+        
+        # 내용 해시 {경로: 해시} / {해시: 경로} - 내용이 같은 파일(복사/이동/mtime만 변경)은 추출 생략
+        # 해시 계산은 파일 전체를 읽어야 하므로, 인덱싱된 파일 중 크기가 같은 파일이 있을 때만 계산
+        # (처음 인덱싱할 때나 크기가 다른 파일은 해시 없이 바로 추출)
+        path_digests = {}
+        indexed_sizes = set()  # 인덱싱된 파일 크기
+        for path, (digest, size) in self.db.get_all_content_hashes().items():
+            if path not in indexed_mtimes:
+                continue
+            if digest:
+                path_digests[path] = digest
+            if size is not None:
+                indexed_sizes.add(size)
+        digest_paths = {digest: path for path, digest in path_digests.items()}
+        retry_saved = set()  # 이번 인덱싱 중 재시도 워커가 다시 저장한 파일 (해시와 내용이 다를 수 있음)
+        digest_updates = []  # DB에 저장할 (경로, 해시, 크기)
+        submitted_sizes = {}  # {경로: 파일 크기} 추출을 제출한 파일
+        
+        # 문서 속성만 인덱싱된 파일 - 변경이 없어도 전체 추출을 다시 시도
+        degraded_paths = self.db.get_degraded_files()
+        degraded_retried = []
+        
         batch_size = 2  # 2개 파일마다 DB Commit (즉시 저장)
         batch = []
         last_progress_time = time.time()
         stall_warning_threshold = 120  # 2분 동안 진행 없으면 경고
         file_delay = 0.01  # 파일 처리 간 0.01초 지연 (즉각적인 활동 감지)
         
-        for i, file_path in enumerate(all_files):
-            if self.stop_flag.is_set():
-                logger.info("인덱싱 중지됨 (사용자 요청)")
-                if self.log_callback:
-                    self.log_callback('Info', '인덱싱 중지', '사용자가 중지를 요청했습니다')
-                break
+        # 텍스트 추출은 스레드 풀에서 병렬 수행하고, 결과는 이 스레드에서 모아 DB 기록 스레드로 넘김
+        # (DB 커밋 중에도 추출 결과 반영을 계속하며, DB 쓰기는 기록 스레드 하나에서만 수행 - SQLite 단일 writer)
+        # (file_path, is_new, current_mtime, future, cancel_event) - 풀별로 제출 순서대로 결과 처리
+        # 느린 COM 추출(수 초)이 앞에 있어도 일반 추출 결과는 계속 반영되도록 대기열을 나눔
+        in_flight = deque()
+        com_in_flight = deque()
+        
+        def finish_done(queue: deque):
+            """대기열 앞쪽에서 추출이 끝난 파일만 결과 반영 (기다리지 않음)"""
+            while queue and queue[0][3].done():
+                finish_extracted(*queue.popleft())
+        
+        def remember_digest(file_path: str, digest: Optional[str]):
+            """DB에 저장된 파일의 내용 해시와 크기 기록 (이후 같은 내용의 파일은 추출 생략)"""
+            size = submitted_sizes.pop(file_path, None)
+            old_digest = path_digests.pop(file_path, None)
+            if old_digest is not None and digest_paths.get(old_digest) == file_path:
+                del digest_paths[old_digest]
+            if digest:
+                path_digests[file_path] = digest
+                digest_paths[digest] = file_path
+            if size is not None:
+                indexed_sizes.add(size)
+            retry_saved.discard(file_path)
+            digest_updates.append((file_path, digest or '', size))
+        
+        def forget_retry_saved():
+            """재시도 워커가 다시 저장한 파일의 해시를 매칭 대상에서 제거"""
+            with self._retry_saved_lock:
+                if not self._retry_saved_paths:
+                    return
+                paths = list(self._retry_saved_paths)
+                self._retry_saved_paths.clear()
+            
+            for path in paths:
+                retry_saved.add(path)
+                old_digest = path_digests.pop(path, None)
+                if old_digest is not None and digest_paths.get(old_digest) == path:
+                    del digest_paths[old_digest]
+        
+        # DB 기록 스레드 작업: ('insert' | 'update', [(path, content, mtime, token_count, digest)])
+        #                      또는 ('mtime', [(path, mtime)])
+        write_queue = Queue(maxsize=DB_WRITE_QUEUE_SIZE)
+        failed_updates = []  # 기록 스레드에서 저장에 실패한 수정 파일 (통계는 이 스레드에서 반영)
+        
+        def save_rows(kind: str, rows: list):
+            """DB 기록 스레드에서 모은 작업 저장"""
+            nonlocal last_progress_time
+            
+            if kind == 'mtime':
+                # mtime만 바뀌고 내용은 그대로인 파일
+                for path, mtime in rows:
+                    try:
+                        self.db.update_file_mtime(path, mtime)
+                    except Exception as e:
+                        logger.error(f"mtime 갱신 오류 [{path}]: {e}")
+                return
             
-            # 사용자 활동 체크 - 키보드/마우스 입력 감지 시 대기
-            if self.activity_monitor and self.enable_activity_monitor:
-                if self.activity_monitor.is_user_active():
-                    # 사용자 활동 감지 - 즉시 일시정지
-                    self.stats['paused_count'] += 1
-                    idle_time = self.activity_monitor.get_idle_time()
-                    logger.info(f"⏸️ 사용자 활동 감지 (즉시 중단) - 2초 대기 중...")
-                    self._update_status(f"⏸️ 사용자 작업 중 - 2초 대기 중...")
-                    
-                    # UI 로그
+            rows_for_db = [(path, content, mtime) for path, content, mtime, _, _ in rows]
+            if kind == 'insert':
+                try:
+                    # 배치 저장 (토큰 수/해시 제외)
+                    self.db.insert_files_batch(rows_for_db)
+                except Exception as e:
+                    logger.error(f"DB 배치 저장 오류: {e}")
                     if self.log_callback:
-                        self.log_callback('Info', '일시정지', '⏸️ 사용자 작업 중 - 2초 대기')
-                    
-                    # 유휴 상태가 될 때까지 대기 (2초 동안 입력 없을 때까지)
-                    # check_interval을 0.1초로 줄여서 더 즉각적으로 반응
-                    if not self.activity_monitor.wait_until_idle(check_interval=0.1, stop_flag=self.stop_flag):
-                        # 중지 요청됨
+                        self.log_callback('Error', 'DB 저장', f'배치 저장 오류: {str(e)}')
+                    return
+                saved = rows
+            else:
+                try:
+                    self.db.update_files_batch(rows_for_db)
+                    saved = rows
+                except Exception:
+                    # 한 파일 때문에 전체가 실패하지 않도록 파일별로 다시 저장
+                    saved = []
+                    for row in rows:
+                        try:
+                            self.db.update_file(*row[:3])
+                            saved.append(row)
+                        except Exception as e:
+                            logger.error(f"DB 업데이트 오류 [{row[0]}]: {e}")
+                            self._log_error(row[0], e)
+                            failed_updates.append(row[0])
+            
+            # DB 저장 완료 로그 생성
+            for saved_path, saved_content, _, saved_token_count, saved_digest in saved:
+                remember_digest(saved_path, saved_digest)
+                self._log_success(saved_path, len(saved_content), saved_token_count, db_saved=True, content=saved_content)
+            
+            last_progress_time = time.time()  # 진행 시간 업데이트
+        
+        def db_writer():
+            """DB 기록 스레드 - 대기 중인 같은 종류의 작업은 한 트랜잭션으로 합쳐서 저장, None을 받으면 종료"""
+            item = write_queue.get()
+            while item is not None:
+                kind, rows = item
+                item = ()  # 다음 작업 (아직 꺼내지 않음)
+                
+                # 밀린 작업이 있으면 같은 종류끼리 합침 (순서는 유지)
+                while len(rows) < DB_WRITE_COALESCE_FILES:
+                    try:
+                        item = write_queue.get_nowait()
+                    except Empty:
+                        item = ()
                         break
-                    
-                    # 재개
-                    logger.info("▶️ 사용자 활동 없음 (2초 경과) - 인덱싱 재개")
-                    self._update_status("▶️ 인덱싱 재개 중...")
-                    if self.log_callback:
-                        self.log_callback('Info', '재개', '▶️ 인덱싱 재개됨')
-            
-            # 진행 상황 체크 (2분 이상 멈춤 감지)
-            current_time = time.time()
-            if current_time - last_progress_time > stall_warning_threshold:
-                warning_msg = f"⚠ 인덱싱 진행 지연 감지: {file_path} 처리 중 {stall_warning_threshold}초 경과"
-                logger.warning(warning_msg)
-                if self.log_callback:
-                    self.log_callback('Error', '진행 지연', f'{os.path.basename(file_path)} 처리 중 지연')
-                last_progress_time = current_time
-            
+                    if item is None or item[0] != kind:
+                        break
+                    rows = rows + item[1]
+                    item = ()
+                
+                try:
+                    save_rows(kind, rows)
+                except Exception as e:
+                    logger.error(f"DB 기록 오류: {e}")
+                
+                # 배치 저장 후 지연 (IO 부하 감소) - 종료 요청만 남았으면 생략
+                if kind == 'insert' and item is not None:
+                    time.sleep(0.5)
+                
+                if item == ():
+                    item = write_queue.get()
+        
+        writer_thread = threading.Thread(target=db_writer, name='db-writer', daemon=True)
+        writer_thread.start()
+        
+        def finish_extracted(file_path: str, is_new: bool, current_mtime: float, future, cancel_event):
+            """추출이 끝난 파일을 배치에 추가하거나 DB 기록 스레드로 넘김"""
+            forget_retry_saved()
             try:
-                # 진행 상황 콜백
-                if self.progress_callback:
-                    self.progress_callback(i + 1, len(all_files), file_path)
+                # 텍스트 추출 결과 (타임아웃 체크)
+                result = self._extract_text_safe(file_path, future, cancel_event)
+                
+                if not result:
+                    self.stats['skipped_files'] += 1
+                    return
                 
-                # 파일 잠금 체크 제거 - 임시 파일 복사로 처리하므로 불필요
-                # 각 파일 타입의 extract 함수가 _copy_to_temp를 사용하여
-                # 사용자가 열어둔 파일도 안전하게 인덱싱합니다
+                digest, content, source_path = result
                 
-                # 파일 크기 체크 (100MB 초과 시 스킵)
-                try:
-                    file_size = os.path.getsize(file_path)
-                    if file_size > MAX_FILE_SIZE:
-                        self._log_skip(file_path, f"Size exceeded ({file_size / 1024 / 1024:.1f}MB)")
-                        self.stats['skipped_files'] += 1
-                        continue
-                except Exception:
-                    pass
+                if source_path == file_path:
+                    # mtime만 바뀌고 내용은 그대로 - 추출/재색인 없이 mtime만 갱신
+                    # (제출 시 수정 파일로 집계했으므로 변경 없음으로 옮김)
+                    write_queue.put(('mtime', [(file_path, current_mtime)]))
+                    submitted_sizes.pop(file_path, None)
+                    if not is_new:
+                        self.stats['modified_files'] -= 1
+                    self.stats['skipped_files'] += 1
+                    self.stats['unchanged_files'] += 1
+                    detail = "이전 처리 완료 (내용 변경 없음)"
+                    self._add_log_to_memory('이전완료', file_path, detail)
+                    if self.log_callback:
+                        self.log_callback('이전완료', os.path.basename(file_path), detail)
+                    return
+                
+                if source_path is not None:
+                    # 같은 내용의 다른 파일(복사/이동)이 이미 인덱싱됨 - 그 텍스트 재사용
+                    # (해시 조회 후 재시도 워커가 그 파일을 다시 저장했으면 직접 추출)
+                    content = None if source_path in retry_saved else self.db.get_file_content(source_path)
+                    if content is None:
+                        content = self._extract_text_safe(file_path)
+                
+                if not content:
+                    self.stats['skipped_files'] += 1
+                    return
+                
+                # 토큰 수 계산
+                token_count = self._count_tokens(content)
+                
+                if is_new:
+                    # 새 파일은 배치에 추가 (로그는 DB 저장 완료 후 생성)
+                    batch.append((file_path, content, current_mtime, token_count, digest))
+                    self.stats['indexed_files'] += 1
+                else:
+                    # 수정된 파일은 바로 업데이트 (로그는 DB 저장 완료 후 생성, 실패 시 통계는 마지막에 보정)
+                    write_queue.put(('update', [(file_path, content, current_mtime, token_count, digest)]))
+                    self.stats['indexed_files'] += 1
+                
+                # 배치가 가득 찼으면 DB 기록 스레드로 넘김 (중지 요청 시에는 최종 배치 저장에서 처리)
+                if len(batch) >= batch_size and not self.stop_flag.is_set():
+                    write_queue.put(('insert', batch[:]))
+                    batch.clear()
+            
+            except Exception as e:
+                self._handle_file_error(file_path, e)
+        
+        try:
+            for i, file_path in enumerate(all_files):
+                if self.stop_flag.is_set():
+                    logger.info("인덱싱 중지됨 (사용자 요청)")
+                    if self.log_callback:
+                        self.log_callback('Info', '인덱싱 중지', '사용자가 중지를 요청했습니다')
+                    break
+                
+                # 사용자 활동 체크 - 키보드/마우스 입력 감지 시 대기
+                if self.activity_monitor and self.enable_activity_monitor:
+                    if self.activity_monitor.is_user_active():
+                        # 사용자 활동 감지 - 즉시 일시정지
+                        self.stats['paused_count'] += 1
+                        idle_time = self.activity_monitor.get_idle_time()
+                        logger.info(f"⏸️ 사용자 활동 감지 (즉시 중단) - 2초 대기 중...")
+                        self._update_status(f"⏸️ 사용자 작업 중 - 2초 대기 중...")
+                        
+                        # UI 로그
+                        if self.log_callback:
+                            self.log_callback('Info', '일시정지', '⏸️ 사용자 작업 중 - 2초 대기')
+                        
+                        # 유휴 상태가 될 때까지 대기 (2초 동안 입력 없을 때까지)
+                        # check_interval을 0.1초로 줄여서 더 즉각적으로 반응
+                        if not self.activity_monitor.wait_until_idle(check_interval=0.1, stop_flag=self.stop_flag):
+                            # 중지 요청됨
+                            break
+                        
+                        # 재개
+                        logger.info("▶️ 사용자 활동 없음 (2초 경과) - 인덱싱 재개")
+                        self._update_status("▶️ 인덱싱 재개 중...")
+                        if self.log_callback:
+                            self.log_callback('Info', '재개', '▶️ 인덱싱 재개됨')
                 
-                # 증분 인덱싱: New or Modified?
-                current_mtime = os.path.getmtime(file_path)
-                indexed_mtime = self.db.get_file_mtime(file_path)
+                # 진행 상황 체크 (2분 이상 멈춤 감지)
+                current_time = time.time()
+                if current_time - last_progress_time > stall_warning_threshold:
+                    warning_msg = f"⚠ 인덱싱 진행 지연 감지: {file_path} 처리 중 {stall_warning_threshold}초 경과"
+                    logger.warning(warning_msg)
+                    if self.log_callback:
+                        self.log_callback('Error', '진행 지연', f'{os.path.basename(file_path)} 처리 중 지연')
+                    last_progress_time = current_time
                 
-                if indexed_mtime is not None:
-                    # 파일이 이미 인덱싱됨
-                    if abs(current_mtime - indexed_mtime) < 1.0:
+                try:
+                    # 진행 상황 콜백
+                    if self.progress_callback:
+                        self.progress_callback(i + 1, len(all_files), file_path)
+                    
+                    # 파일 잠금 체크 제거 - 임시 파일 복사로 처리하므로 불필요
+                    # 각 파일 타입의 extract 함수가 _copy_to_temp를 사용하여
+                    # 사용자가 열어둔 파일도 안전하게 인덱싱합니다
+                    
+                    # 크기와 mtime - 수집 단계의 stat을 재사용하고, 없을 때만 stat 호출
+                    file_stat = file_stats.get(file_path)
+                    if file_stat is None:
+                        file_stat = os.stat(file_path)
+                    
+                    # 증분 인덱싱: New or Modified?
+                    current_mtime = file_stat.st_mtime
+                    indexed_mtime = indexed_mtimes.get(file_path)
+                    
+                    # 이미 인덱싱되었고 수정되지 않은 파일 (대부분의 경우) - 크기 확인 없이 바로 건너뜀
+                    if (indexed_mtime is not None and abs(current_mtime - indexed_mtime) < 1.0
+                            and file_path not in degraded_paths):
                         # 수정되지 않음 - 이전 처리 완료 로그
                         self.stats['skipped_files'] += 1
+                        self.stats['unchanged_files'] += 1
                         
                         # 로그 출력
                         filename = os.path.basename(file_path)
@@ -1232,136 +1624,141 @@ class FileIndexer:
                             self.log_callback('이전완료', filename, detail)
                         
                         continue
-                    else:
+                    
+                    # 파일 크기 체크 (추출할 파일만, 100MB 초과 시 스킵)
+                    file_size = file_stat.st_size
+                    if file_size > MAX_FILE_SIZE:
+                        self._log_skip(file_path, f"Size exceeded ({file_size / 1024 / 1024:.1f}MB)")
+                        self.stats['skipped_files'] += 1
+                        continue
+                    
+                    if file_path in degraded_paths:
+                        degraded_retried.append(file_path)
+                    
+                    if indexed_mtime is not None:
                         # 수정됨 - 재인덱싱
                         is_new = False
                         self.stats['modified_files'] += 1
-                else:
-                    # 새 파일
-                    is_new = True
-                    self.stats['new_files'] += 1
-                
-                # 중지 요청 체크 (파일 처리 전)
-                if self.stop_flag.is_set():
-                    logger.info("인덱싱 중지됨 (사용자 요청 - 파일 처리 전)")
-                    if self.log_callback:
-                        self.log_callback('Info', '인덱싱 중지', '사용자가 중지를 요청했습니다')
-                    break
-                
-                # 현재 처리 중인 파일 로그
-                self._log_indexing(file_path)
-                
-                # 텍스트 추출 (타임아웃 체크)
-                content = self._extract_text_safe(file_path)
-                
-                if content:
-                    # 토큰 수 계산
-                    token_count = self._count_tokens(content)
+                    else:
+                        # 새 파일
+                        is_new = True
+                        self.stats['new_files'] += 1
+                    
+                    # 중지 요청 체크 (파일 처리 전)
+                    if self.stop_flag.is_set():
+                        logger.info("인덱싱 중지됨 (사용자 요청 - 파일 처리 전)")
+                        if self.log_callback:
+                            self.log_callback('Info', '인덱싱 중지', '사용자가 중지를 요청했습니다')
+                        break
                     
-                    if is_new:
-                        # 새 파일은 배치에 추가 (로그는 DB 저장 완료 후 생성)
-                        batch.append((file_path, content, current_mtime, token_count))
-                        self.stats['indexed_files'] += 1
+                    # 현재 처리 중인 파일 로그
+                    self._log_indexing(file_path)
+                    
+                    # 텍스트 추출을 스레드 풀에 제출 (내용 해시가 같은 파일은 추출 생략)
+                    # 크기가 같은 인덱싱된 파일이 있을 때만 해시 계산 (내용이 같으려면 크기가 같아야 함)
+                    submitted_sizes[file_path] = file_size
+                    future, cancel_event = self._submit_extraction(file_path, digest_paths,
+                                                                   hash_content=file_size in indexed_sizes)
+                    if self._is_com_extraction(file_path):
+                        queue, max_in_flight = com_in_flight, COM_MAX_IN_FLIGHT
                     else:
-                        # 수정된 파일은 즉시 업데이트
-                        try:
-                            self.db.update_file(file_path, content, current_mtime)
-                            self.stats['indexed_files'] += 1
-                            # DB 저장 완료 상태로 로그
-                            self._log_success(file_path, len(content), token_count, db_saved=True, content=content)
-                        except Exception as e:
-                            logger.error(f"DB 업데이트 오류 [{file_path}]: {e}")
-                            self._log_error(file_path, e)
-                            self.stats['error_files'] += 1
-                            continue
+                        queue, max_in_flight = in_flight, EXTRACT_MAX_IN_FLIGHT
+                    queue.append((file_path, is_new, current_mtime, future, cancel_event))
                     
-                    # 배치가 가득 찼으면 DB에 저장
-                    if len(batch) >= batch_size:
-                        # 중지 요청 체크 (배치 저장 전)
-                        if self.stop_flag.is_set():
-                            logger.info("인덱싱 중지됨 (사용자 요청 - 배치 저장 전)")
-                            if self.log_callback:
-                                self.log_callback('Info', '인덱싱 중지', '사용자가 중지를 요청했습니다')
-                            break
-                        
-                        try:
-                            # 배치 저장 (토큰 수 제외)
-                            batch_for_db = [(path, content, mtime) for path, content, mtime, _ in batch]
-                            self.db.insert_files_batch(batch_for_db)
-                            # 배치 저장 후 DB 저장 완료 로그 생성
-                            for saved_path, saved_content, _, saved_token_count in batch:
-                                # 3. DB 저장 완료 로그
-                                self._log_success(saved_path, len(saved_content), saved_token_count, db_saved=True, content=saved_content)
-                            batch = []
-                            last_progress_time = time.time()  # 진행 시간 업데이트
-                            # 배치 저장 후 지연 (IO 부하 감소)
-                            time.sleep(0.5)
-                        except Exception as e:
-                            logger.error(f"DB 배치 저장 오류: {e}")
-                            if self.log_callback:
-                                self.log_callback('Error', 'DB 저장', f'배치 저장 오류: {str(e)}')
-                            batch = []
-                else:
-                    self.stats['skipped_files'] += 1
+                    # 이미 끝난 추출 결과 반영
+                    finish_done(in_flight)
+                    finish_done(com_in_flight)
+                    
+                    # 동시 추출 상한에 도달하면 가장 먼저 제출한 파일부터 결과 반영
+                    while len(queue) >= max_in_flight:
+                        finish_extracted(*queue.popleft())
+                    
+                    # 파일 처리 간 지연 (CPU/IO 부하 감소)
+                    time.sleep(file_delay)
                 
-                # 파일 처리 간 지연 (CPU/IO 부하 감소)
-                time.sleep(file_delay)
-            
-            except PermissionError as e:
-                # 파일 잠금
-                self._log_skip(file_path, "File locked or Permission denied")
-                self.stats['skipped_files'] += 1
+                except Exception as e:
+                    self._handle_file_error(file_path, e)
             
-            except Exception as e:
-                error_type = type(e).__name__
-                error_msg = str(e)
-                logger.error(f"파일 처리 오류 [{file_path}]: {error_type} - {error_msg}")
-                logger.error(f"상세 정보: {traceback.format_exc()}")
-                
-                # UI에 에러 원인 표시
-                self._log_error(file_path, f"{error_type}: {error_msg}")
-                self.stats['error_files'] += 1
-                
-                # 타임아웃 에러인 경우 특별히 표시
-                if 'timeout' in error_msg.lower() or error_type == 'TimeoutError':
-                    if self.log_callback:
-                        self.log_callback('Error', os.path.basename(file_path), f'⏱ 타임아웃 (60초 초과)')
-                elif 'memory' in error_msg.lower():
-                    if self.log_callback:
-                        self.log_callback('Error', os.path.basename(file_path), f'💾 메모리 부족')
-                elif error_type == 'PermissionError':
-                    if self.log_callback:
-                        self.log_callback('Error', os.path.basename(file_path), f'🔒 권한 오류')
+            # 남은 추출 결과 반영 (중지 요청 시에는 대기하지 않음)
+            for queue in (in_flight, com_in_flight):
+                while queue and not self.stop_flag.is_set():
+                    finish_done(in_flight)
+                    finish_done(com_in_flight)
+                    if queue:
+                        finish_extracted(*queue.popleft())
         
-        # 남은 배치 저장
-        if batch:
-            try:
+        finally:
+            # 시작되지 않은 추출 작업은 취소, 실행 중인 작업은 다음 페이지/행에서 중단 (기다리지 않음)
+            for _, _, _, future, cancel_event in (*in_flight, *com_in_flight):
+                future.cancel()
+                cancel_event.set()
+            
+            # 남은 배치 저장 후 DB 기록 스레드 종료 대기
+            if batch:
                 logger.info(f"최종 배치 저장 중: {len(batch)}개 파일")
-                # 배치 저장 (토큰 수 제외)
-                batch_for_db = [(path, content, mtime) for path, content, mtime, _ in batch]
-                self.db.insert_files_batch(batch_for_db)
-                # 배치 저장 후 DB 저장 완료 로그 생성
-                for saved_path, saved_content, _, saved_token_count in batch:
-                    self._log_success(saved_path, len(saved_content), saved_token_count, db_saved=True, content=saved_content)
-                logger.info(f"✓ 최종 배치 저장 완료: {len(batch)}개 파일")
-            except Exception as e:
-                error_msg = f"DB 최종 배치 저장 오류: {type(e).__name__} - {str(e)}"
-                logger.error(error_msg)
-                logger.error(traceback.format_exc())
-                if self.log_callback:
-                    self.log_callback('Error', '최종 DB 저장', f'배치 저장 실패: {str(e)}')
+                write_queue.put(('insert', batch[:]))
+                batch.clear()
+            write_queue.put(None)
+            writer_thread.join()
+        
+        # 저장에 실패한 수정 파일은 인덱싱 수에서 빼고 오류로 집계
+        self.stats['indexed_files'] -= len(failed_updates)
+        self.stats['error_files'] += len(failed_updates)
+        
+        # 저장된 파일의 내용 해시 기록 (다음 인덱싱에서 같은 내용의 파일은 추출 생략)
+        self.db.set_content_hashes(digest_updates)
+        
+        # 전체 추출을 다시 시도한 파일의 표시 해제 (또 실패하면 재시도 큐에서 다시 표시됨)
+        self.db.set_degraded_files(degraded_retried, degraded=False)
+    
+    def _handle_file_error(self, file_path: str, e: Exception):
+        """파일 처리 중 예외 기록 (UI에 원인 표시)"""
+        if isinstance(e, PermissionError):
+            # 파일 잠금
+            self._log_skip(file_path, "File locked or Permission denied")
+            self.stats['skipped_files'] += 1
+            return
+        
+        error_type = type(e).__name__
+        error_msg = str(e)
+        logger.error(f"파일 처리 오류 [{file_path}]: {error_type} - {error_msg}")
+        logger.error(f"상세 정보: {traceback.format_exc()}")
+        
+        # UI에 에러 원인 표시
+        self._log_error(file_path, f"{error_type}: {error_msg}")
+        self.stats['error_files'] += 1
+        
+        # 타임아웃 에러인 경우 특별히 표시
+        if 'timeout' in error_msg.lower() or error_type == 'TimeoutError':
+            if self.log_callback:
+                self.log_callback('Error', os.path.basename(file_path), f'⏱ 타임아웃 (60초 초과)')
+        elif 'memory' in error_msg.lower():
+            if self.log_callback:
+                self.log_callback('Error', os.path.basename(file_path), f'💾 메모리 부족')
+        elif error_type == 'PermissionError':
+            if self.log_callback:
+                self.log_callback('Error', os.path.basename(file_path), f'🔒 권한 오류')
     
-    def _cleanup_deleted_files(self, current_files: List[str]):
-        """삭제된 파일을 DB에서 제거"""
+    def _cleanup_deleted_files(self, current_files: Optional[List[str]] = None,
+                               indexed_files: Optional[List[str]] = None):
+        """
+        삭제된 파일을 DB에서 제거
+        
+        Args:
+            current_files: 이번에 수집된 파일 목록 (없으면 실제 파일 존재 여부로 판단)
+            indexed_files: 이미 조회해 둔 DB 파일 경로 (없으면 DB에서 조회)
+        """
         try:
-            # 현재 파일 세트
-            current_file_set = set(current_files)
-            
-            # DB의 모든 파일 경로 조회
-            indexed_files = self.db.get_all_indexed_paths()
+            # DB의 모든 파일 경로 조회 (인덱싱 시작 시 조회한 목록이 있으면 재사용)
+            if indexed_files is None:
+                indexed_files = self.db.get_all_indexed_paths()
             
             # 삭제된 파일 찾기
-            deleted_files = [f for f in indexed_files if f not in current_file_set]
+            if current_files is None:
+                deleted_files = [f for f in indexed_files if not os.path.exists(f)]
+            else:
+                current_file_set = set(current_files)
+                deleted_files = [f for f in indexed_files if f not in current_file_set]
             
             # 삭제
             for file_path in deleted_files:
@@ -1374,22 +1771,168 @@ class FileIndexer:
         except Exception as e:
             logger.error(f"삭제된 파일 정리 오류: {e}")
     
-    def _extract_text_safe(self, file_path: str) -> Optional[str]:
+    def _submit_extraction(self, file_path: str, digest_paths: Optional[Dict[str, str]] = None,
+                           hash_content: bool = True):
         """
-        안전한 텍스트 추출 (타임아웃, 예외 처리)
+        텍스트 추출 작업을 스레드 풀에 제출
         
-        Returns:
-            추출된 텍스트 또는 None
-        """
+        COM 확장자(.doc/.ppt/.xls/.hwp)는 COM 전용 풀, 나머지는 일반 추출 풀에서 처리합니다.
+        
+        Args:
+            file_path: 파일 경로
+            digest_paths: {내용 해시: 인덱싱된 경로} - 주어지면 먼저 내용 해시를 계산하고
+                          같은 내용이 이미 인덱싱되어 있으면 추출을 생략 (_run_hashed_extraction)
+            hash_content: False면 해시 계산 없이 추출 (결과 형식은 _run_hashed_extraction과 동일, 해시=None)
+        
+        Returns:
+            (future, cancel_event) - cancel_event를 설정하면 추출이 페이지/행 단위로 중단됨
+        """
+        pool = self._com_pool if self._is_com_extraction(file_path) else self._parse_pool
+        cancel_event = ExtractionCancelEvent(pool)
+        if digest_paths is None:
+            cancel_event.task = functools.partial(self._run_extraction, file_path, cancel_event)
+        else:
+            cancel_event.task = functools.partial(
+                self._run_hashed_extraction, file_path, cancel_event, digest_paths, hash_content
+            )
+        return pool.submit(cancel_event.task), cancel_event
+    
+    def _resubmit_extraction(self, cancel_event: ExtractionCancelEvent):
+        """
+        교체된 COM 풀에서 실행되지 못하고 취소된 추출 작업을 현재 COM 풀에 다시 제출
+        
+        Returns:
+            새 future, 다시 제출할 작업이 아니면 None (중지/정리로 취소된 작업)
+        """
+        with self._com_pool_lock:
+            pool = self._com_pool
+        if cancel_event.pool is pool or cancel_event.pool is self._parse_pool:
+            return None
+        
+        cancel_event.pool = pool
+        return pool.submit(cancel_event.task)
+    
+    def _replace_com_pool(self, hung_pool: ThreadPoolExecutor):
+        """
+        COM 호출이 멈춘 스레드가 있는 풀을 새 풀로 교체
+        
+        Word/Excel/한글의 Open이 대화상자 등에서 멈추면 취소 이벤트로 중단할 수 없어
+        COM 스레드를 계속 점유합니다. 멈춘 스레드는 버리고(이전 방식과 같이) 이후 파일은
+        새 스레드에서 처리하며, 이전 풀에서 대기 중이던 작업은 취소되어 새 풀에 다시 제출됩니다.
+        """
+        with self._com_pool_lock:
+            if self._com_pool is not hung_pool:
+                return  # 이미 교체됨
+            self._com_pool = ThreadPoolExecutor(max_workers=COM_EXTRACT_WORKERS, thread_name_prefix='extract-com')
+        
+        hung_pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning("⚠ COM 추출이 시간 초과 후에도 끝나지 않아 COM 추출 스레드 풀을 교체했습니다")
+    
+    def _is_com_extraction(self, file_path: str) -> bool:
+        """COM 추출 풀에서 처리할 파일인지 확인 (Office/한글 COM 사용 가능 + COM 확장자)"""
+        return WIN32COM_AVAILABLE and os.path.splitext(file_path)[1].lower() in COM_EXTENSIONS
+    
+    def _run_extraction(self, file_path: str, cancel_event: ExtractionCancelEvent) -> Optional[str]:
+        """풀 스레드에서 실행되는 추출 (현재 스레드에 취소 이벤트 등록)"""
+        if cancel_event.started_at is None:
+            cancel_event.started_at = time.monotonic()
+        self._extract_local.cancel_event = cancel_event
         try:
-            # 타임아웃 적용 (60초)
-            @with_timeout(PARSE_TIMEOUT)
-            def extract():
-                return self._extract_text(file_path)
-            
-            return extract()
+            return self._extract_text(file_path)
+        finally:
+            self._extract_local.cancel_event = None
+    
+    def _run_hashed_extraction(self, file_path: str, cancel_event: ExtractionCancelEvent,
+                               digest_paths: Dict[str, str], hash_content: bool = True):
+        """
+        내용 해시 확인 후 추출 (풀 스레드에서 실행)
+        
+        Returns:
+            (digest, content, source_path)
+            - 같은 내용이 이미 인덱싱되어 있으면 content=None, source_path=그 파일 경로
+            - 아니면 content=추출된 텍스트, source_path=None (hash_content=False면 digest=None)
+        """
+        cancel_event.started_at = time.monotonic()
+        digest = self._hash_file(file_path) if hash_content else None
+        source_path = digest_paths.get(digest) if digest else None
+        if source_path is not None:
+            return digest, None, source_path
+        return digest, self._run_extraction(file_path, cancel_event), None
+    
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        """
+        파일 내용 해시 계산 (BLAKE2b 128비트, 1MB 단위로 읽음)
+        
+        Returns:
+            16진수 해시 문자열 또는 None (읽기 실패 시)
+        """
+        try:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(file_path, 'rb') as f:
+                while True:
+                    chunk = f.read(HASH_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        except OSError as e:
+            logger.debug("내용 해시 계산 실패 [%s]: %s", file_path, e)
+            return None
+    
+    def _check_cancelled(self):
+        """추출 취소 요청 확인 (타임아웃/중지 시 TimeoutError 발생)"""
+        cancel_event = getattr(self._extract_local, 'cancel_event', None)
+        if cancel_event is not None and cancel_event.is_set():
+            raise TimeoutError("Extraction cancelled")
+    
+    def _extract_text_safe(self, file_path: str, future=None,
+                           cancel_event: Optional[ExtractionCancelEvent] = None) -> Optional[str]:
+        """
+        안전한 텍스트 추출 (타임아웃, 예외 처리)
         
-        except TimeoutError:
+        Args:
+            file_path: 파일 경로
+            future: 추출 스레드 풀에 이미 제출된 작업 (없으면 여기서 제출)
+            cancel_event: future의 취소 이벤트 (_submit_extraction 반환값)
+        
+        Returns:
+            추출된 텍스트 (해시 확인 작업이면 _run_hashed_extraction 결과) 또는 None
+        """
+        try:
+            if future is None:
+                future, cancel_event = self._submit_extraction(file_path)
+            
+            # 타임아웃 적용 (60초) - 풀 대기열에서 기다린 시간은 빼고 실행을 시작한 시점부터 계산
+            while True:
+                started_at = cancel_event.started_at if cancel_event is not None else None
+                if started_at is None:
+                    timeout = PARSE_TIMEOUT
+                else:
+                    timeout = max(started_at + PARSE_TIMEOUT - time.monotonic(), 0)
+                try:
+                    return future.result(timeout=timeout)
+                except FutureCancelledError:
+                    # COM 풀 교체로 취소된 대기 작업은 새 풀에서 다시 실행
+                    new_future = self._resubmit_extraction(cancel_event) if cancel_event is not None else None
+                    if new_future is None:
+                        raise
+                    future = new_future
+                except FutureTimeoutError:
+                    started_at = cancel_event.started_at if cancel_event is not None else None
+                    # 아직 앞선 추출을 기다리는 중이거나 실행 시간이 남았으면 계속 대기
+                    if started_at is None or started_at + PARSE_TIMEOUT > time.monotonic():
+                        continue
+                    raise
+        
+        except FutureTimeoutError:
+            # 시간 초과된 추출은 취소 (대기 중이면 실행 안 함, 실행 중이면 다음 페이지/행에서 중단)
+            future.cancel()
+            if cancel_event is not None:
+                cancel_event.set()
+                # 취소 요청으로도 끝나지 않는 COM 호출은 스레드째 버림 (COM 스레드 수가 적어 다른 파일이 막힘)
+                if future.running() and cancel_event.pool is self._com_pool:
+                    self._replace_com_pool(cancel_event.pool)
+            
             self._log_skip(file_path, f"Parsing timeout (>{PARSE_TIMEOUT}s)")
             # 재시도 목록에 추가
             self._add_to_retry_queue(file_path, f"Parsing timeout (>{PARSE_TIMEOUT}s)")
@@ -1416,47 +1959,125 @@ class FileIndexer:
                 self._log_skip(file_path, f"Parse error: {str(e)[:100]}")
             return None
     
-    def _collect_files(self, root_path: str) -> List[str]:
+    def _collect_files(self, root_path: str, file_stats: Optional[Dict[str, os.stat_result]] = None) -> List[str]:
         """
         파일 시스템 크롤링 (제외 규칙 적용)
         
         Args:
             root_path: 루트 디렉토리
+            file_stats: 지정하면 수집한 파일의 stat 결과를 {경로: stat}으로 채움
         
         Returns:
             파일 경로 리스트
         """
-        files = []
+        # 디렉토리 읽기(scandir)는 여러 스레드에서 동시에 수행 (디렉토리마다 대기하는 I/O 지연을 겹침)
+        # 결과는 디렉토리별로 모았다가 os.walk와 같은 순서(목록 순 깊이 우선)로 합침
+        results = {}  # {디렉토리: (파일 리스트, 하위 디렉토리 리스트)}
         
         try:
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                # 제외할 디렉토리 필터링
-                dirnames[:] = [d for d in dirnames if self._should_include_dir(d, dirpath)]
-                
-                if self.stop_flag.is_set():
-                    break
+            with ThreadPoolExecutor(max_workers=COLLECT_WORKERS, thread_name_prefix='collect') as pool:
+                pending = {pool.submit(self._scan_dirs, root_path, file_stats)}
                 
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    
-                    # 파일 포함 여부 확인
-                    if not self._should_include_file(filename, file_path):
-                        continue
+                while pending:
+                    if self.stop_flag.is_set():
+                        for future in pending:
+                            future.cancel()
+                        break
                     
-                    files.append(file_path)
+                    done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        scanned, unvisited = future.result()
+                        results.update(scanned)
+                        # 작업량 한도로 남긴 디렉토리는 나누어 다른 스레드에 분배
+                        for dirpath in unvisited:
+                            pending.add(pool.submit(self._scan_dirs, dirpath, file_stats))
         
         except Exception as e:
             logger.error(f"파일 수집 오류 [{root_path}]: {e}")
         
+        files = []
+        stack = [root_path]
+        while stack:
+            dir_files, subdirs = results.get(stack.pop(), ((), ()))
+            files.extend(dir_files)
+            stack.extend(reversed(subdirs))
+        
         return files
     
-    def _should_include_dir(self, dirname: str, dirpath: str) -> bool:
+    def _scan_dirs(self, dirpath: str, file_stats: Optional[Dict[str, os.stat_result]] = None):
+        """
+        디렉토리와 하위 디렉토리를 COLLECT_BATCH_DIRS개까지 읽기 (수집 스레드에서 실행)
+        
+        디렉토리마다 작업을 제출하지 않고 한 작업에서 여러 디렉토리를 처리해 작업 전달 부담을 줄입니다.
+        
+        Returns:
+            ({디렉토리: (파일 리스트, 하위 디렉토리 리스트)}, 아직 읽지 않은 디렉토리 리스트)
+        """
+        scanned = {}
+        stack = [dirpath]
+        
+        while stack and len(scanned) < COLLECT_BATCH_DIRS and not self.stop_flag.is_set():
+            current = stack.pop()
+            dir_files, subdirs = self._scan_dir(current, file_stats)
+            scanned[current] = (dir_files, subdirs)
+            stack.extend(subdirs)
+        
+        return scanned, stack
+    
+    def _scan_dir(self, dirpath: str, file_stats: Optional[Dict[str, os.stat_result]] = None):
+        """
+        디렉토리 하나 읽기 (제외 규칙 적용, 수집 스레드에서 실행)
+        
+        file_stats를 지정하면 포함된 파일의 stat도 기록합니다
+        (Windows에서는 디렉토리 목록에 들어 있어 추가 시스템 호출 없음).
+        
+        Returns:
+            (포함할 파일 경로 리스트, 방문할 하위 디렉토리 경로 리스트)
+        """
+        files = []
+        subdirs = []
+        
+        # 제외 경로 접두사는 디렉토리마다 한 번만 판정 - 디렉토리 경로가 가장 긴 접두사보다 길고
+        # 접두사에 해당하지 않으면 그 안의 항목도 해당하지 않으므로 항목별 검사 생략
+        check_prefix = len(dirpath) < self._EXCLUDED_PATH_PREFIX_MAX_LEN or self._has_excluded_prefix(dirpath)
+        
+        try:
+            # os.walk 대신 scandir (DirEntry의 d_type으로 추가 stat 호출 회피)
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    
+                    if is_dir:
+                        # 심볼릭 링크 디렉토리는 따라가지 않음 (os.walk 기본 동작과 동일)
+                        if not entry.is_symlink() and self._should_include_dir(entry.name, dirpath, check_prefix):
+                            subdirs.append(entry.path)
+                        continue
+                    
+                    # 파일 포함 여부 확인 (entry.path는 이미 결합된 경로)
+                    if self._should_include_file(entry.name, entry.path, check_prefix):
+                        files.append(entry.path)
+                        if file_stats is not None:
+                            try:
+                                file_stats[entry.path] = entry.stat()
+                            except OSError:
+                                pass  # 처리 단계에서 다시 stat
+        except OSError as e:
+            # 접근 불가 디렉토리는 건너뜀 (os.walk의 기본 onerror 무시와 동일)
+            logger.debug(f"디렉토리 읽기 실패 [{dirpath}]: {e}")
+        
+        return files, subdirs
+    
+    def _should_include_dir(self, dirname: str, dirpath: str, check_prefix: bool = True) -> bool:
         """
         디렉토리 포함 여부 확인
         
         Args:
             dirname: 디렉토리 이름
-            dirpath: 디렉토리 전체 경로
+            dirpath: 상위 디렉토리 경로
+            check_prefix: False면 제외 경로 접두사 검사 생략 (상위 디렉토리에서 이미 판정한 경우)
         
         Returns:
             True면 포함, False면 제외
@@ -1466,24 +2087,23 @@ class FileIndexer:
             return False
         
         # 제외 디렉토리 목록에 있으면 제외
-        if dirname.lower() in self.EXCLUDED_DIRS:
+        if dirname.lower() in self._EXCLUDED_DIRS_LOWER:
             return False
         
         # 전체 경로가 제외 경로 접두사에 해당하면 제외
-        full_path = os.path.join(dirpath, dirname)
-        for excluded_prefix in self.EXCLUDED_PATH_PREFIXES:
-            if full_path.lower().startswith(excluded_prefix.lower()):
-                return False
+        if check_prefix and self._has_excluded_prefix(os.path.join(dirpath, dirname)):
+            return False
         
         return True
     
-    def _should_include_file(self, filename: str, filepath: str) -> bool:
+    def _should_include_file(self, filename: str, filepath: str, check_prefix: bool = True) -> bool:
         """
         파일 포함 여부 확인
         
         Args:
             filename: 파일 이름
             filepath: 파일 전체 경로
+            check_prefix: False면 제외 경로 접두사 검사 생략 (디렉토리에서 이미 판정한 경우)
         
         Returns:
             True면 포함, False면 제외
@@ -1493,61 +2113,49 @@ class FileIndexer:
             return False
         
         # Office 임시 파일 제외 (~$, ~WRL)
-        for prefix in self.OFFICE_TEMP_PREFIXES:
-            if filename.startswith(prefix):
-                return False
+        if filename.startswith(self.OFFICE_TEMP_PREFIXES):
+            return False
         
         # 제외 파일 목록에 있으면 제외
         if filename in self.EXCLUDED_FILES:
             return False
         
-        # 확장자 확인
-        ext = Path(filepath).suffix.lower()
+        # 확장자 확인 (Path 객체 생성 없이 endswith 튜플로 매칭)
+        filename_lower = filename.lower()
         
         # 제외 확장자면 제외
-        if ext in self.EXCLUDED_EXTENSIONS:
+        if filename_lower.endswith(self._EXCLUDED_EXT_SUFFIXES):
             return False
         
         # 지원하는 확장자가 아니면 제외
-        if ext not in self.SUPPORTED_TEXT_EXTENSIONS and ext not in self.SUPPORTED_DOC_EXTENSIONS:
+        if not filename_lower.endswith(self._SUPPORTED_EXT_SUFFIXES):
             return False
         
         # 전체 경로가 제외 경로 접두사에 해당하면 제외
-        for excluded_prefix in self.EXCLUDED_PATH_PREFIXES:
-            if filepath.lower().startswith(excluded_prefix.lower()):
-                return False
+        if check_prefix and self._has_excluded_prefix(filepath):
+            return False
         
-        # 사용자 정의 제외 패턴 체크
-        for pattern in self.custom_excluded_patterns:
-            # 간단한 패턴 매칭 (와일드카드 지원)
-            if self._match_pattern(filepath, pattern):
+        # 사용자 정의 제외 패턴 체크 (미리 컴파일한 정규식 하나로 매칭, 와일드카드 지원)
+        # 전체 경로 소문자 변환은 패턴이 있을 때만 수행
+        if self._custom_pattern_regex is not None:
+            if self._custom_pattern_regex.match(os.path.normcase(filepath.lower())):
                 return False
         
         return True
     
-    def _match_pattern(self, filepath: str, pattern: str) -> bool:
-        """
-        경로가 패턴과 매칭되는지 확인
-        
-        Args:
-            filepath: 파일 경로
-            pattern: 패턴 (와일드카드 * 지원)
-        
-        Returns:
-            True면 매칭됨
-        """
-        import fnmatch
-        
-        # 대소문자 구분 없이 매칭
-        return fnmatch.fnmatch(filepath.lower(), pattern.lower())
+    def _has_excluded_prefix(self, path: str) -> bool:
+        """경로가 시스템 제외 경로 접두사로 시작하는지 확인 (가장 긴 접두사 길이만큼만 소문자 변환)"""
+        return path[:self._EXCLUDED_PATH_PREFIX_MAX_LEN].lower().startswith(self._EXCLUDED_PATH_PREFIXES_LOWER)
     
     def _is_valid_name(self, name: str) -> bool:
         """특수 문자로 시작하는 파일/폴더 필터링"""
         if not name:
             return False
-        return name[0].isalnum() or ord(name[0]) >= 0xAC00  # 영문, 숫자, 한글
+        # 영문, 숫자, 한글 - 한글 음절 이후 문자(전각 괄호 '（주）' 등)도 허용하므로 ord() 대신 문자 비교
+        first = name[0]
+        return first.isalnum() or first >= '\uac00'
     
-    def _copy_to_temp(self, file_path: str) -> Optional[str]:
+    def _copy_to_temp(self, file_path: str, max_bytes: Optional[int] = None) -> Optional[str]:
         """
         파일을 임시 폴더에 복사 (강제 복사)
         
@@ -1556,6 +2164,7 @@ class FileIndexer:
         
         Args:
             file_path: 원본 파일 경로
+            max_bytes: 지정하면 앞부분 max_bytes만 복사 (앞부분만 읽는 텍스트 파일용)
         
         Returns:
             임시 파일 경로 또는 None (복사 실패 시)
@@ -1568,20 +2177,32 @@ class FileIndexer:
             filename = os.path.basename(file_path)
             temp_file_path = os.path.join(temp_dir, filename)
             
+            # 앞부분만 필요한 경우 - 최대 크기만큼만 읽어서 복사 (큰 로그 파일 전체 복사 방지)
+            if max_bytes is not None:
+                try:
+                    with open(file_path, 'rb') as src, open(temp_file_path, 'wb') as dst:
+                        dst.write(src.read(max_bytes))
+                    logger.debug("✅ 임시 파일 복사 완료 (앞부분 %d바이트): %s", max_bytes, filename)
+                    return temp_file_path
+                except Exception as e:
+                    logger.info(f"⛔ 파일 복사 완전 실패 - Skip: {filename} (원인: {e})")
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    return None
+            
             # 방법 1: shutil.copy2 시도 (가장 빠름)
             try:
                 shutil.copy2(file_path, temp_file_path)
-                logger.debug(f"✅ 임시 파일 복사 완료 (shutil): {filename}")
+                logger.debug("✅ 임시 파일 복사 완료 (shutil): %s", filename)
                 return temp_file_path
             except (PermissionError, IOError) as e:
                 # 방법 2: 바이너리 읽기 모드로 직접 복사 (더 강력)
-                logger.debug(f"shutil 복사 실패, 직접 읽기 시도: {filename}")
+                logger.debug("shutil 복사 실패, 직접 읽기 시도: %s", filename)
                 try:
                     with open(file_path, 'rb') as src:
                         data = src.read()
                     with open(temp_file_path, 'wb') as dst:
                         dst.write(data)
-                    logger.debug(f"✅ 임시 파일 복사 완료 (직접 읽기): {filename}")
+                    logger.debug("✅ 임시 파일 복사 완료 (직접 읽기): %s", filename)
                     return temp_file_path
                 except Exception as e2:
                     logger.info(f"⛔ 파일 복사 완전 실패 - Skip: {filename} (원인: {e2})")
@@ -1593,7 +2214,7 @@ class FileIndexer:
                     return None
             
         except Exception as e:
-            logger.debug(f"임시 파일 복사 실패 [{file_path}]: {e}")
+            logger.debug("임시 파일 복사 실패 [%s]: %s", file_path, e)
             return None
     
     def _cleanup_temp(self, temp_file_path: str):
@@ -1608,9 +2229,9 @@ class FileIndexer:
                 # 임시 디렉토리 전체 삭제
                 temp_dir = os.path.dirname(temp_file_path)
                 shutil.rmtree(temp_dir, ignore_errors=True)
-                logger.debug(f"임시 파일 정리 완료: {os.path.basename(temp_file_path)}")
+                logger.debug("임시 파일 정리 완료: %s", temp_file_path)
         except Exception as e:
-            logger.debug(f"임시 파일 정리 오류: {e}")
+            logger.debug("임시 파일 정리 오류: %s", e)
     
     def _is_file_locked(self, file_path: str) -> bool:
         """
@@ -1633,12 +2254,12 @@ class FileIndexer:
             file_handle.close()
         except PermissionError:
             # 권한 없거나 다른 프로그램이 독점 사용 중
-            logger.debug(f"파일 잠금 감지 (PermissionError): {file_path}")
+            logger.debug("파일 잠금 감지 (PermissionError): %s", file_path)
             return True
         except IOError as e:
             # 파일이 사용 중인 경우
             if e.errno in [errno.EACCES, errno.EPERM, 13, 32]:
-                logger.debug(f"파일 잠금 감지 (IOError {e.errno}): {file_path}")
+                logger.debug("파일 잠금 감지 (IOError %s): %s", e.errno, file_path)
                 return True
         except OSError as e:
             # Windows 특화: 다른 프로세스가 파일을 사용 중
@@ -1648,11 +2269,11 @@ class FileIndexer:
                'locked' in error_msg or \
                'access denied' in error_msg or \
                'permission denied' in error_msg:
-                logger.debug(f"파일 잠금 감지 (OSError): {file_path}")
+                logger.debug("파일 잠금 감지 (OSError): %s", file_path)
                 return True
         except Exception as e:
             # 예상치 못한 오류 - 안전하게 잠금으로 간주
-            logger.debug(f"파일 체크 중 예외 발생 (안전하게 Skip): {file_path} - {e}")
+            logger.debug("파일 체크 중 예외 발생 (안전하게 Skip): %s - %s", file_path, e)
             return True
         
         # 방법 2: Windows msvcrt를 사용한 추가 체크 (Python 3.8+)
@@ -1670,7 +2291,7 @@ class FileIndexer:
                 except (IOError, OSError):
                     # 잠금 실패 - 다른 프로세스가 사용 중
                     file_handle.close()
-                    logger.debug(f"파일 잠금 감지 (msvcrt): {file_path}")
+                    logger.debug("파일 잠금 감지 (msvcrt): %s", file_path)
                     return True
             except Exception:
                 # msvcrt 체크 실패 - 기본값(안전) 사용
@@ -1680,6 +2301,41 @@ class FileIndexer:
         return False
     
     
+    def _build_extractors(self) -> Dict[str, Callable[[str], Optional[str]]]:
+        """
+        확장자 → 추출 함수 디스패치 테이블 생성
+        
+        Returns:
+            {확장자: 추출 함수} (사용 불가능한 라이브러리의 확장자는 제외)
+        """
+        extractors = {
+            '.csv': self._extract_csv,
+            '.hwp': self._extract_hwp,
+        }
+        
+        # Word 문서 / PowerPoint (zip 안의 XML 직접 파싱 - 별도 라이브러리 불필요)
+        extractors['.docx'] = self._extract_docx
+        extractors['.pptx'] = self._extract_pptx
+        
+        # Excel
+        if XLSX_AVAILABLE:
+            extractors['.xlsx'] = self._extract_xlsx
+        
+        # PDF
+        if PDF_AVAILABLE:
+            extractors['.pdf'] = self._extract_pdf
+        
+        # Office 구버전 (COM)
+        if WIN32COM_AVAILABLE:
+            extractors['.doc'] = self._extract_doc
+            extractors['.ppt'] = self._extract_ppt
+            extractors['.xls'] = self._extract_xls
+        
+        # 텍스트 파일 (다른 항목보다 우선)
+        extractors.update(dict.fromkeys(self.SUPPORTED_TEXT_EXTENSIONS, self._extract_text_file))
+        
+        return extractors
+    
     def _extract_text(self, file_path: str) -> Optional[str]:
         """
         파일에서 텍스트 추출
@@ -1690,42 +2346,13 @@ class FileIndexer:
         Returns:
             추출된 텍스트 또는 None
         """
-        ext = Path(file_path).suffix.lower()
+        ext = os.path.splitext(file_path)[1].lower()
+        handler = self._extractors.get(ext)
+        if handler is None:
+            return None
         
         try:
-            # 텍스트 파일
-            if ext in self.SUPPORTED_TEXT_EXTENSIONS:
-                return self._extract_text_file(file_path)
-            
-            # Word 문서
-            elif ext == '.docx' and DOCX_AVAILABLE:
-                return self._extract_docx(file_path)
-            elif ext == '.doc' and WIN32COM_AVAILABLE:
-                return self._extract_doc(file_path)
-            
-            # PowerPoint
-            elif ext == '.pptx' and PPTX_AVAILABLE:
-                return self._extract_pptx(file_path)
-            elif ext == '.ppt' and WIN32COM_AVAILABLE:
-                return self._extract_ppt(file_path)
-            
-            # Excel
-            elif ext == '.xlsx' and XLSX_AVAILABLE:
-                return self._extract_xlsx(file_path)
-            elif ext == '.xls' and WIN32COM_AVAILABLE:
-                return self._extract_xls(file_path)
-            
-            # CSV
-            elif ext == '.csv':
-                return self._extract_csv(file_path)
-            
-            # PDF
-            elif ext == '.pdf' and PDF_AVAILABLE:
-                return self._extract_pdf(file_path)
-            
-            # HWP
-            elif ext == '.hwp':
-                return self._extract_hwp(file_path)
+            return handler(file_path)
         
         except Exception as e:
             logger.error(f"텍스트 추출 오류 [{file_path}]: {e}")
@@ -1735,64 +2362,87 @@ class FileIndexer:
     def _extract_text_file(self, file_path: str) -> Optional[str]:
         """
         텍스트 파일 읽기 (인코딩 자동 감지)
-        UTF-8 → CP949 → chardet 순서로 시도
+        BOM → UTF-8 → CP949 → (캐시된 인코딩) → chardet 순서로 시도
         
-        🛡️ 안전 모드: 원본 파일을 건드리지 않고 임시 복사본으로 인덱싱합니다!
+        🛡️ 안전 모드: 원본 파일은 읽기 전용으로 열어 앞부분만 메모리로 읽습니다!
+        (임시 복사본을 쓰고 다시 읽지 않고, 읽은 바이트로 모든 인코딩을 시도)
         """
-        temp_file = None
+        try:
+            # 1단계: 원본 파일 앞부분 읽기 (최대 길이만큼의 문자를 담을 수 있는 크기)
+            with open(file_path, 'rb') as f:
+                raw_data = f.read(TEXT_COPY_BYTES)
+        except OSError as e:
+            logger.info(f"⛔ 텍스트 파일 읽기 실패 (사용 중) - Skip: {os.path.basename(file_path)} (원인: {e})")
+            self._log_skip(file_path, "파일이 사용 중이거나 접근 불가")
+            return None
         
         try:
-            # 1단계: 원본 파일을 임시 폴더에 복사
-            temp_file = self._copy_to_temp(file_path)
-            
-            if not temp_file:
-                logger.info(f"⛔ 텍스트 파일 복사 실패 (사용 중) - Skip: {os.path.basename(file_path)}")
-                self._log_skip(file_path, "파일이 사용 중이거나 접근 불가")
-                return None
-            
-            # 2단계: 임시 파일에서 텍스트 추출
-            # 1차 시도: UTF-8
+            # 2단계: 텍스트 디코딩
+            # 1차 시도: BOM이 있으면 해당 인코딩, 없으면 UTF-8
+            bom_encoding = next((enc for bom, enc in TEXT_BOMS if raw_data.startswith(bom)), None)
             try:
-                with open(temp_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    return content[:100000]  # 최대 100KB
+                if bom_encoding:
+                    return self._decode_text(raw_data, bom_encoding, errors='ignore')
+                return self._decode_text(raw_data, 'utf-8')
             except (UnicodeDecodeError, UnicodeError):
                 pass
             
             # 2차 시도: CP949 (한글 Windows 기본 인코딩)
             try:
-                with open(temp_file, 'r', encoding='cp949') as f:
-                    content = f.read()
-                    return content[:100000]
+                return self._decode_text(raw_data, 'cp949')
             except (UnicodeDecodeError, UnicodeError):
                 pass
             
-            # 3차 시도: chardet 자동 감지
-            with open(temp_file, 'rb') as f:
-                raw_data = f.read(1000000)  # 최대 1MB 읽기
-                result = chardet.detect(raw_data)
-                encoding = result['encoding']
-                
-                if encoding:
-                    try:
-                        content = raw_data.decode(encoding, errors='ignore')
-                        return content[:100000]
-                    except Exception:
-                        pass
+            # chardet 대신 캐시된 인코딩 시도 (같은 폴더의 같은 확장자 파일에서 chardet으로 감지한 인코딩)
+            cache_key = os.path.splitext(file_path)[1].lower() + '|' + os.path.dirname(file_path)
+            with self._encoding_cache_lock:
+                cached_encoding = self._encoding_cache.get(cache_key)
+            
+            if cached_encoding:
+                try:
+                    return self._decode_text(raw_data, cached_encoding)
+                except (UnicodeDecodeError, UnicodeError, LookupError):
+                    pass
+            
+            # 3차 시도: chardet 자동 감지 (앞부분 64KB 샘플로 판별)
+            result = chardet_impl.detect(raw_data[:ENCODING_DETECT_SAMPLE])
+            encoding = result['encoding']
+            
+            if encoding:
+                try:
+                    content = self._decode_text(raw_data, encoding, errors='ignore')
+                    # 신뢰도가 낮은 추측은 같은 폴더의 다른 파일에 적용하지 않음
+                    if (result.get('confidence') or 0) >= ENCODING_CACHE_MIN_CONFIDENCE:
+                        self._remember_encoding(cache_key, encoding)
+                    return content
+                except Exception:
+                    pass
             
             # 최종: ignore 모드로 UTF-8 시도
-            with open(temp_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return content[:100000]
+            return self._decode_text(raw_data, 'utf-8', errors='ignore')
         
         except Exception as e:
-            logger.debug(f"텍스트 파일 읽기 오류 [{file_path}]: {e}")
+            logger.debug("텍스트 파일 읽기 오류 [%s]: %s", file_path, e)
             return None
-            
-        finally:
-            # 3단계: 임시 파일 정리
-            if temp_file:
-                self._cleanup_temp(temp_file)
+    
+    def _decode_text(self, raw_data: bytes, encoding: str, errors: str = 'strict') -> str:
+        """
+        읽은 바이트를 텍스트 모드로 파일을 읽은 것과 같게 디코딩 (줄바꿈 통일, 최대 길이까지만)
+        
+        Args:
+            raw_data: 파일 앞부분 바이트
+            encoding: 인코딩
+            errors: 디코딩 오류 처리 방식
+        """
+        with io.TextIOWrapper(io.BytesIO(raw_data), encoding=encoding, errors=errors) as f:
+            return f.read(MAX_TEXT_LENGTH)
+    
+    def _remember_encoding(self, cache_key: str, encoding: str):
+        """감지된 인코딩을 캐시에 기록 (상한 초과 시 가장 먼저 추가된 항목 제거)"""
+        with self._encoding_cache_lock:
+            if cache_key not in self._encoding_cache and len(self._encoding_cache) >= ENCODING_CACHE_SIZE:
+                del self._encoding_cache[next(iter(self._encoding_cache))]
+            self._encoding_cache[cache_key] = encoding
     
     def _extract_docx(self, file_path: str) -> Optional[str]:
         """
@@ -1811,13 +2461,22 @@ class FileIndexer:
                 self._log_skip(file_path, "파일이 사용 중이거나 접근 불가")
                 return None
             
-            # 2단계: 임시 파일에서 텍스트 추출
-            doc = docx.Document(temp_file)
-            text = '\n'.join([para.text for para in doc.paragraphs])
+            # 2단계: 임시 파일에서 텍스트 추출 (word/document.xml을 스트리밍 파싱, python-docx 객체 생성 생략)
+            text_parts = []
+            with zipfile.ZipFile(temp_file) as z:
+                if 'word/document.xml' in z.NameToInfo:
+                    self._read_ooxml_paragraphs(z, 'word/document.xml', WORD_NS, text_parts, 0)
+                    text = '\n'.join(text_parts)
+                elif DOCX_AVAILABLE:
+                    # 본문 파트 이름이 표준과 다른 문서는 python-docx로 처리
+                    doc = _lazy_import('docx').Document(temp_file)
+                    text = '\n'.join([para.text for para in doc.paragraphs])
+                else:
+                    raise ValueError("Invalid DOCX: word/document.xml not found")
             
-            logger.debug(f"✅ DOCX 파일 인덱싱 완료 (임시 복사본): {os.path.basename(file_path)}")
+            logger.debug("✅ DOCX 파일 인덱싱 완료 (임시 복사본): %s", file_path)
             
-            return text[:100000]
+            return text[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -1833,7 +2492,7 @@ class FileIndexer:
                 self._log_skip(file_path, "파일 접근 불가 - 재시도 예정")
                 self._add_to_retry_queue(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"DOCX 추출 오류 [{filename}]: {e}")
+                logger.debug("DOCX 추출 오류 [%s]: %s", filename, e)
             return None
             
         finally:
@@ -1841,6 +2500,57 @@ class FileIndexer:
             if temp_file:
                 self._cleanup_temp(temp_file)
     
+    def _read_ooxml_paragraphs(self, z: zipfile.ZipFile, part_name: str, ns: str,
+                               text_parts: List[str], text_len: int) -> int:
+        """
+        Office Open XML 파트에서 문단 텍스트만 스트리밍으로 추출
+        
+        <p> 문단마다 <t> 텍스트를 이어 붙여 text_parts에 한 줄씩 추가하고,
+        최대 길이(100KB)에 도달하면 나머지는 읽지 않습니다.
+        
+        Args:
+            z: 열린 zip 파일
+            part_name: 파트 경로 (예: 'word/document.xml')
+            ns: 문단/텍스트 태그 네임스페이스 (WORD_NS 또는 DRAWING_NS)
+            text_parts: 문단 텍스트를 추가할 리스트
+            text_len: 지금까지 추출한 텍스트 길이
+        
+        Returns:
+            추출 후 누적 텍스트 길이
+        """
+        tag_p, tag_t = ns + 'p', ns + 't'
+        tag_tab, tag_br, tag_cr = ns + 'tab', ns + 'br', ns + 'cr'
+        # 탭 정지 위치 정의 (<w:tabs>/<a:tabLst> 안의 <tab>)는 실제 탭 문자가 아님
+        tag_tab_stops = ns + 'tabs' if ns == WORD_NS else ns + 'tabLst'
+        current = []
+        
+        with z.open(part_name) as f:
+            for _, el in ET.iterparse(f, events=('end',)):
+                tag = el.tag
+                if tag == tag_t:
+                    if el.text:
+                        current.append(el.text)
+                elif tag == tag_tab:
+                    current.append('\t')
+                elif tag == tag_br or tag == tag_cr:
+                    current.append('\n')
+                elif tag == tag_tab_stops:
+                    # 방금 자식 <tab>마다 추가한 '\t'를 되돌림
+                    stop_count = len(el)
+                    if stop_count:
+                        del current[-stop_count:]
+                elif tag == tag_p:
+                    paragraph = ''.join(current)
+                    current.clear()
+                    text_parts.append(paragraph)
+                    text_len += len(paragraph) + 1
+                    # 처리한 문단은 메모리에서 해제
+                    el.clear()
+                    if text_len >= MAX_TEXT_LENGTH:
+                        break
+        
+        return text_len
+    
     def _extract_pptx(self, file_path: str) -> Optional[str]:
         """
         PowerPoint에서 텍스트 추출
@@ -1858,17 +2568,27 @@ class FileIndexer:
                 self._log_skip(file_path, "파일이 사용 중이거나 접근 불가")
                 return None
             
-            # 2단계: 임시 파일에서 텍스트 추출
-            prs = Presentation(temp_file)
+            # 2단계: 임시 파일에서 텍스트 추출 (슬라이드 XML을 스트리밍 파싱, python-pptx 객체 생성 생략)
             text_parts = []
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text_parts.append(shape.text)
+            text_len = 0
+            with zipfile.ZipFile(temp_file) as z:
+                # ppt/slides/slide{번호}.xml - 번호 순서대로
+                slide_names = sorted(
+                    (name for name in z.NameToInfo
+                     if name.startswith('ppt/slides/slide') and name.endswith('.xml')
+                     and name[16:-4].isdigit()),
+                    key=lambda name: int(name[16:-4])
+                )
+                for slide_name in slide_names:
+                    self._check_cancelled()
+                    text_len = self._read_ooxml_paragraphs(z, slide_name, DRAWING_NS, text_parts, text_len)
+                    # 최대 길이(100KB)에 도달하면 나머지 슬라이드 생략
+                    if text_len >= MAX_TEXT_LENGTH:
+                        break
             
-            logger.debug(f"✅ PPTX 파일 인덱싱 완료 (임시 복사본): {os.path.basename(file_path)}")
+            logger.debug("✅ PPTX 파일 인덱싱 완료 (임시 복사본): %s", file_path)
             
-            return '\n'.join(text_parts)[:100000]
+            return '\n'.join(text_parts)[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -1884,7 +2604,7 @@ class FileIndexer:
                 self._log_skip(file_path, "파일 접근 불가 - 재시도 예정")
                 self._add_to_retry_queue(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"PPTX 추출 오류 [{filename}]: {e}")
+                logger.debug("PPTX 추출 오류 [%s]: %s", filename, e)
             return None
             
         finally:
@@ -1892,6 +2612,95 @@ class FileIndexer:
             if temp_file:
                 self._cleanup_temp(temp_file)
     
+    def _get_com_app(self, prog_id: str, init: Optional[Callable] = None):
+        """
+        현재 추출 스레드의 COM 인스턴스 반환 (없으면 생성)
+        
+        파일마다 DispatchEx/Quit 하지 않고 스레드별로 인스턴스를 재사용하며,
+        COM_APP_MAX_USES개 문서를 처리하면 새 인스턴스로 교체합니다 (메모리 누적 방지).
+        
+        Args:
+            prog_id: COM ProgID (예: "Word.Application")
+            init: 새 인스턴스 초기화 함수 (없으면 Office 기본 설정: 창/경고 숨김)
+        """
+        local = self._com_local
+        if not getattr(local, 'initialized', False):
+            _lazy_import('pythoncom').CoInitialize()
+            local.initialized = True
+            local.apps = {}
+            local.uses = {}
+        
+        if prog_id in local.apps and local.uses[prog_id] >= COM_APP_MAX_USES:
+            self._release_com_app(prog_id)
+        
+        app = local.apps.get(prog_id)
+        if app is None:
+            # DispatchEx로 완전히 새로운 인스턴스 생성 (사용자 Office 프로그램과 격리)
+            app = _lazy_import('win32com.client').DispatchEx(prog_id)
+            if init is not None:
+                init(app)
+            else:
+                app.Visible = False
+                app.DisplayAlerts = False
+            local.apps[prog_id] = app
+            local.uses[prog_id] = 0
+        
+        local.uses[prog_id] += 1
+        return app
+    
+    def _init_hwp_app(self, hwp):
+        """한글 COM 인스턴스 초기화 (파일 경로 확인 보안 모듈 등록 - 열 때마다 확인 창 방지)"""
+        hwp.RegisterModule("FilePathCheckDLL", "SecurityModule")
+    
+    def _release_com_app(self, prog_id: str):
+        """현재 스레드의 COM 인스턴스 종료 (오류 후에는 다음 파일에서 새로 생성)"""
+        app = getattr(self._com_local, 'apps', {}).pop(prog_id, None)
+        if app is not None:
+            try:
+                app.Quit()
+            except Exception:
+                pass
+    
+    def _release_thread_com_apps(self):
+        """현재 스레드의 모든 COM 인스턴스 종료 및 COM 해제"""
+        local = self._com_local
+        if not getattr(local, 'initialized', False):
+            return
+        
+        for prog_id in list(local.apps):
+            self._release_com_app(prog_id)
+        
+        try:
+            _lazy_import('pythoncom').CoUninitialize()
+        except Exception:
+            pass
+        local.initialized = False
+    
+    def _release_com_apps_in_pool(self, timeout: float = 5.0):
+        """
+        COM 추출 풀의 모든 스레드에서 COM 인스턴스 종료
+        
+        COM 객체는 생성한 스레드에서만 종료할 수 있으므로, 풀 스레드 수만큼 작업을 제출하고
+        Barrier로 각 작업이 서로 다른 스레드를 점유하게 한 뒤 각자 정리합니다.
+        """
+        if not WIN32COM_AVAILABLE:
+            return
+        
+        barrier = threading.Barrier(COM_EXTRACT_WORKERS)
+        
+        def release():
+            try:
+                barrier.wait(timeout=timeout)
+            except threading.BrokenBarrierError:
+                pass
+            self._release_thread_com_apps()
+        
+        try:
+            futures = [self._com_pool.submit(release) for _ in range(COM_EXTRACT_WORKERS)]
+            wait_futures(futures, timeout=timeout + 1)
+        except Exception as e:
+            logger.error(f"COM 인스턴스 정리 오류: {e}")
+    
     def _extract_doc(self, file_path: str) -> Optional[str]:
         """
         구버전 Word 문서(.doc)에서 텍스트 추출
@@ -1912,12 +2721,8 @@ class FileIndexer:
                 return None
             
             # 2단계: 임시 파일로 COM 작업 (원본 파일은 절대 건드리지 않음)
-            pythoncom.CoInitialize()
-            
-            # DispatchEx로 완전히 새로운 Word 인스턴스 생성 (사용자 Word와 격리)
-            word = win32com.client.DispatchEx("Word.Application")
-            word.Visible = False
-            word.DisplayAlerts = False
+            # 스레드별로 재사용하는 Word 인스턴스 (사용자 Word와 격리)
+            word = self._get_com_app("Word.Application")
             
             # 임시 파일 열기 (원본 파일 X)
             doc = word.Documents.Open(
@@ -1926,15 +2731,14 @@ class FileIndexer:
                 ConfirmConversions=False,
                 AddToRecentFiles=False
             )
-            text = doc.Content.Text
-            doc.Close(False)
-            word.Quit()
-            
-            pythoncom.CoUninitialize()
+            try:
+                text = doc.Content.Text
+            finally:
+                doc.Close(False)
             
             logger.info(f"✅ DOC 파일 인덱싱 완료 (임시 복사본 사용): {os.path.basename(file_path)}")
             
-            return text[:100000]
+            return text[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -1942,16 +2746,10 @@ class FileIndexer:
                 logger.info(f"⛔ DOC 파일 접근 불가 - Skip: {os.path.basename(file_path)}")
                 self._log_skip(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"DOC 추출 오류 [{file_path}]: {e}")
+                logger.debug("DOC 추출 오류 [%s]: %s", file_path, e)
             
-            try:
-                word.Quit()
-            except:
-                pass
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            # 오류 후 인스턴스 상태를 신뢰할 수 없으므로 종료 (다음 파일에서 새로 생성)
+            self._release_com_app("Word.Application")
             return None
             
         finally:
@@ -1978,31 +2776,36 @@ class FileIndexer:
                 return None
             
             # 2단계: 임시 파일로 COM 작업
-            pythoncom.CoInitialize()
-            
-            # DispatchEx로 완전히 새로운 PowerPoint 인스턴스 생성 (사용자 PowerPoint와 격리)
-            ppt = win32com.client.DispatchEx("PowerPoint.Application")
-            ppt.Visible = False
-            ppt.DisplayAlerts = False
+            # 스레드별로 재사용하는 PowerPoint 인스턴스 (사용자 PowerPoint와 격리)
+            ppt = self._get_com_app("PowerPoint.Application")
             
             # 임시 파일 열기
             presentation = ppt.Presentations.Open(temp_file, ReadOnly=True, WithWindow=False)
             text_parts = []
             
-            for slide in presentation.Slides:
-                for shape in slide.Shapes:
-                    if hasattr(shape, "TextFrame"):
-                        if hasattr(shape.TextFrame, "TextRange"):
-                            text_parts.append(shape.TextFrame.TextRange.Text)
-            
-            presentation.Close()
-            ppt.Quit()
+            text_len = 0
             
-            pythoncom.CoUninitialize()
+            try:
+                for slide in presentation.Slides:
+                    self._check_cancelled()
+                    for shape in slide.Shapes:
+                        # hasattr 이중 조회 대신 바로 접근 (COM 이름 조회 호출 감소)
+                        try:
+                            text = shape.TextFrame.TextRange.Text
+                        except Exception:
+                            continue
+                        text_parts.append(text)
+                        text_len += len(text) + 1
+                    
+                    # 최대 길이(100KB)에 도달하면 나머지 슬라이드 생략
+                    if text_len >= MAX_TEXT_LENGTH:
+                        break
+            finally:
+                presentation.Close()
             
             logger.info(f"✅ PPT 파일 인덱싱 완료 (임시 복사본 사용): {os.path.basename(file_path)}")
             
-            return '\n'.join(text_parts)[:100000]
+            return '\n'.join(text_parts)[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -2010,16 +2813,10 @@ class FileIndexer:
                 logger.info(f"⛔ PPT 파일 접근 불가 - Skip: {os.path.basename(file_path)}")
                 self._log_skip(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"PPT 추출 오류 [{file_path}]: {e}")
+                logger.debug("PPT 추출 오류 [%s]: %s", file_path, e)
             
-            try:
-                ppt.Quit()
-            except:
-                pass
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            # 오류 후 인스턴스 상태를 신뢰할 수 없으므로 종료 (다음 파일에서 새로 생성)
+            self._release_com_app("PowerPoint.Application")
             return None
             
         finally:
@@ -2034,6 +2831,7 @@ class FileIndexer:
         
         🛡️ 안전 모드: 원본 파일을 건드리지 않고 임시 복사본으로 인덱싱합니다!
         """
+        openpyxl = _lazy_import('openpyxl')
         temp_file = None
         
         try:
@@ -2046,27 +2844,45 @@ class FileIndexer:
                 return None
             
             # 2단계: 임시 파일에서 텍스트 추출
-            workbook = openpyxl.load_workbook(temp_file, data_only=True, read_only=True)
+            # 메모리로 읽어서 열기 (read_only 모드가 파일 핸들을 잡고 있지 않도록)
+            with open(temp_file, 'rb') as f:
+                # keep_links=False: 외부 링크 캐시는 읽지 않음
+                workbook = openpyxl.load_workbook(io.BytesIO(f.read()), data_only=True, read_only=True,
+                                                  keep_links=False)
             text_parts = []
+            append = text_parts.append  # 셀마다 호출되므로 메서드 조회를 한 번만
+            text_len = 0
             
-            # 모든 시트 순회
-            for sheet_name in workbook.sheetnames:
-                # 시트 이름 추가 (검색 가능하도록)
-                text_parts.append(f"\n[시트: {sheet_name}]\n")
-                
-                sheet = workbook[sheet_name]
-                
-                # 모든 행 순회
-                for row in sheet.iter_rows(values_only=True):
-                    for cell_value in row:
-                        if cell_value is not None:
-                            text_parts.append(str(cell_value))
-            
-            workbook.close()
+            try:
+                # 모든 시트 순회
+                for sheet_name in workbook.sheetnames:
+                    # 시트 이름 추가 (검색 가능하도록)
+                    append(f"\n[시트: {sheet_name}]\n")
+                    
+                    sheet = workbook[sheet_name]
+                    
+                    # 모든 행 순회 (최대 길이(100KB)에 도달하면 나머지 행/시트 생략)
+                    for row in sheet.iter_rows(values_only=True):
+                        self._check_cancelled()
+                        for cell_value in row:
+                            if cell_value is not None:
+                                # 대부분의 셀은 이미 문자열 - str() 호출 생략
+                                cell_text = cell_value if type(cell_value) is str else str(cell_value)
+                                append(cell_text)
+                                text_len += len(cell_text) + 1
+                                if text_len >= MAX_TEXT_LENGTH:
+                                    break  # 열이 아주 많은 행도 셀 단위로 중단
+                        if text_len >= MAX_TEXT_LENGTH:
+                            break
+                    
+                    if text_len >= MAX_TEXT_LENGTH:
+                        break
+            finally:
+                workbook.close()
             
-            logger.debug(f"✅ XLSX 파일 인덱싱 완료 (임시 복사본): {os.path.basename(file_path)}")
+            logger.debug("✅ XLSX 파일 인덱싱 완료 (임시 복사본): %s", file_path)
             
-            return ' '.join(text_parts)[:100000]
+            return ' '.join(text_parts)[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -2082,7 +2898,7 @@ class FileIndexer:
                 self._log_skip(file_path, "파일 접근 불가 - 재시도 예정")
                 self._add_to_retry_queue(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"XLSX 추출 오류 [{filename}]: {e}")
+                logger.debug("XLSX 추출 오류 [%s]: %s", filename, e)
             return None
             
         finally:
@@ -2109,37 +2925,52 @@ class FileIndexer:
                 return None
             
             # 2단계: 임시 파일로 COM 작업
-            pythoncom.CoInitialize()
-            
-            # DispatchEx로 완전히 새로운 Excel 인스턴스 생성 (사용자 Excel과 격리)
-            excel = win32com.client.DispatchEx("Excel.Application")
-            excel.Visible = False
-            excel.DisplayAlerts = False
+            # 스레드별로 재사용하는 Excel 인스턴스 (사용자 Excel과 격리)
+            excel = self._get_com_app("Excel.Application")
             
             # 임시 파일 열기
             workbook = excel.Workbooks.Open(temp_file, ReadOnly=True)
             text_parts = []
             
-            # 모든 시트 순회
-            for sheet in workbook.Sheets:
-                # 시트 이름 추가 (검색 가능하도록)
-                sheet_name = sheet.Name
-                text_parts.append(f"\n[시트: {sheet_name}]\n")
-                
-                used_range = sheet.UsedRange
-                for row in used_range.Rows:
-                    for cell in row.Cells:
-                        if cell.Value is not None:
-                            text_parts.append(str(cell.Value))
-            
-            workbook.Close(False)
-            excel.Quit()
+            text_len = 0
             
-            pythoncom.CoUninitialize()
+            try:
+                # 모든 시트 순회
+                for sheet in workbook.Sheets:
+                    self._check_cancelled()
+                    # 시트 이름 추가 (검색 가능하도록)
+                    sheet_name = sheet.Name
+                    text_parts.append(f"\n[시트: {sheet_name}]\n")
+                    
+                    # 셀마다 COM 호출하지 않고 시트 전체 값을 한 번에 가져옴
+                    # (Value2는 날짜/통화 변환을 하지 않아 Value보다 빠름)
+                    data = sheet.UsedRange.Value2
+                    if data is None:
+                        continue
+                    if not isinstance(data, tuple):
+                        data = ((data,),)  # 셀이 하나뿐이면 단일 값이 반환됨
+                    
+                    # 최대 길이(100KB)에 도달하면 나머지 행/시트 생략 (시트가 하나뿐이어도 셀 단위로 중단)
+                    for row in data:
+                        self._check_cancelled()
+                        for cell_value in row:
+                            if cell_value is not None:
+                                cell_text = cell_value if type(cell_value) is str else str(cell_value)
+                                text_parts.append(cell_text)
+                                text_len += len(cell_text) + 1
+                                if text_len >= MAX_TEXT_LENGTH:
+                                    break
+                        if text_len >= MAX_TEXT_LENGTH:
+                            break
+                    
+                    if text_len >= MAX_TEXT_LENGTH:
+                        break
+            finally:
+                workbook.Close(False)
             
             logger.info(f"✅ XLS 파일 인덱싱 완료 (임시 복사본 사용): {os.path.basename(file_path)}")
             
-            return ' '.join(text_parts)[:100000]
+            return ' '.join(text_parts)[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -2147,16 +2978,10 @@ class FileIndexer:
                 logger.info(f"⛔ XLS 파일 접근 불가 - Skip: {os.path.basename(file_path)}")
                 self._log_skip(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"XLS 추출 오류 [{file_path}]: {e}")
+                logger.debug("XLS 추출 오류 [%s]: %s", file_path, e)
             
-            try:
-                excel.Quit()
-            except:
-                pass
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            # 오류 후 인스턴스 상태를 신뢰할 수 없으므로 종료 (다음 파일에서 새로 생성)
+            self._release_com_app("Excel.Application")
             return None
             
         finally:
@@ -2175,8 +3000,8 @@ class FileIndexer:
         temp_file = None
         
         try:
-            # 1단계: 원본 파일을 임시 폴더에 복사
-            temp_file = self._copy_to_temp(file_path)
+            # 1단계: 원본 파일을 임시 폴더에 복사 (앞부분만)
+            temp_file = self._copy_to_temp(file_path, max_bytes=TEXT_COPY_BYTES)
             
             if not temp_file:
                 logger.info(f"⛔ CSV 파일 복사 실패 (사용 중) - Skip: {os.path.basename(file_path)}")
@@ -2194,15 +3019,20 @@ class FileIndexer:
                 try:
                     with open(temp_file, 'r', encoding=encoding, errors='ignore') as f:
                         csv_reader = csv.reader(f)
+                        text_len = 0
                         
                         for row in csv_reader:
                             # 각 행의 셀들을 탭으로 구분하여 추가
                             row_text = '\t'.join(str(cell) for cell in row if cell)
                             if row_text.strip():
                                 text_parts.append(row_text)
+                                text_len += len(row_text) + 1
+                                # 최대 길이(100KB)에 도달하면 나머지 행 생략
+                                if text_len >= MAX_TEXT_LENGTH:
+                                    break
                     
                     content_read = True
-                    logger.debug(f"✅ CSV 파일 인덱싱 완료 (임시 복사본, 인코딩: {encoding}): {os.path.basename(file_path)}")
+                    logger.debug("✅ CSV 파일 인덱싱 완료 (임시 복사본, 인코딩: %s): %s", encoding, file_path)
                     break
                     
                 except (UnicodeDecodeError, LookupError):
@@ -2212,7 +3042,7 @@ class FileIndexer:
                 logger.info(f"⚠️ CSV 파일 인코딩 처리 실패: {os.path.basename(file_path)}")
                 return None
             
-            return '\n'.join(text_parts)[:100000]
+            return '\n'.join(text_parts)[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -2224,7 +3054,7 @@ class FileIndexer:
                 self._log_skip(file_path, "파일 접근 불가 - 재시도 예정")
                 self._add_to_retry_queue(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"CSV 추출 오류 [{filename}]: {e}")
+                logger.debug("CSV 추출 오류 [%s]: %s", filename, e)
             return None
             
         finally:
@@ -2239,6 +3069,7 @@ class FileIndexer:
         
         🛡️ 안전 모드: 원본 파일을 건드리지 않고 임시 복사본으로 인덱싱합니다!
         """
+        fitz = _lazy_import('fitz')
         temp_file = None
         
         try:
@@ -2253,17 +3084,25 @@ class FileIndexer:
             # 2단계: 임시 파일에서 텍스트 추출
             doc = fitz.open(temp_file)
             text_parts = []
+            text_len = 0
+            # 합자 보존 없이 텍스트만 추출 (이미지/합자 처리 생략, 페이지 영역 밖 텍스트 제외)
+            text_flags = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
             
-            # 최대 100페이지까지만
-            for page_num in range(min(len(doc), 100)):
-                page = doc[page_num]
-                text_parts.append(page.get_text())
-            
-            doc.close()
+            try:
+                # 최대 100페이지까지만 (최대 길이(100KB)에 도달하면 나머지 페이지 생략)
+                for page in doc:
+                    if page.number >= 100 or text_len >= MAX_TEXT_LENGTH:
+                        break
+                    self._check_cancelled()
+                    page_text = page.get_text("text", flags=text_flags, sort=False)
+                    text_parts.append(page_text)
+                    text_len += len(page_text) + 1
+            finally:
+                doc.close()
             
-            logger.debug(f"✅ PDF 파일 인덱싱 완료 (임시 복사본): {os.path.basename(file_path)}")
+            logger.debug("✅ PDF 파일 인덱싱 완료 (임시 복사본): %s", file_path)
             
-            return '\n'.join(text_parts)[:100000]
+            return '\n'.join(text_parts)[:MAX_TEXT_LENGTH]
             
         except Exception as e:
             error_msg = str(e).lower()
@@ -2279,7 +3118,7 @@ class FileIndexer:
                 self._log_skip(file_path, "파일 접근 불가 - 재시도 예정")
                 self._add_to_retry_queue(file_path, "파일 접근 불가")
             else:
-                logger.debug(f"PDF 추출 오류 [{filename}]: {e}")
+                logger.debug("PDF 추출 오류 [%s]: %s", filename, e)
             return None
             
         finally:
@@ -2294,13 +3133,13 @@ class FileIndexer:
         2차: olefile 라이브러리 시도
         
         🛡️ 안전 모드: 원본 파일을 건드리지 않고 임시 복사본으로 인덱싱합니다!
-        ⏱️ 타임아웃: 30초 이상 걸리면 자동 Skip
+        ⏱️ 타임아웃: PARSE_TIMEOUT(60초) 이상 걸리면 자동 Skip
         """
         temp_file = None
-        hwp_timeout = 30  # HWP 파일 처리 타임아웃: 30초
         
         # 1차 시도: COM 객체 (가장 정확)
         if WIN32COM_AVAILABLE:
+            hwp = None
             try:
                 # 임시 파일 복사
                 temp_file = self._copy_to_temp(file_path)
@@ -2310,80 +3149,53 @@ class FileIndexer:
                     self._log_skip(file_path, "파일이 사용 중이거나 접근 불가")
                     return None
                 
-                # COM 작업을 스레드에서 실행하여 타임아웃 적용
-                result_container = [None]
-                error_container = [None]
+                # COM 추출 풀 스레드에서 실행 - 스레드별로 재사용하는 한글 인스턴스 (사용자 한글과 격리)
+                # 타임아웃은 _extract_text_safe가 처리하고, 텍스트 조회 루프에서 취소를 확인
+                hwp = self._get_com_app("HWPFrame.HwpObject", init=self._init_hwp_app)
+                hwp.Open(temp_file)  # 임시 파일 사용!
                 
-                def hwp_extract_thread():
+                text_parts = []
+                text_len = 0
+                try:
+                    hwp.InitScan()
                     try:
-                        pythoncom.CoInitialize()
-                        
-                        # DispatchEx로 완전히 새로운 한글 인스턴스 생성 (사용자 한글과 격리)
-                        hwp = win32com.client.DispatchEx("HWPFrame.HwpObject")
-                        hwp.RegisterModule("FilePathCheckDLL", "SecurityModule")
-                        hwp.Open(temp_file)  # 임시 파일 사용!
-                        
-                        hwp.InitScan()
-                        text_parts = []
-                        
-                        while True:
-                            text = hwp.GetText()
-                            if not text:
+                        while text_len < MAX_TEXT_LENGTH:
+                            self._check_cancelled()
+                            # GetText() -> (상태, 텍스트): 0=정보 없음, 1=끝, 101 이상=초기화 안 됨/완료
+                            state, text = hwp.GetText()
+                            if state <= 1 or state >= 101:
                                 break
-                            text_parts.append(text)
-                        
+                            if text:
+                                text_parts.append(text)
+                                text_len += len(text)
+                    finally:
                         hwp.ReleaseScan()
-                        hwp.Quit()
-                        
-                        pythoncom.CoUninitialize()
-                        
-                        result_container[0] = ''.join(text_parts)[:100000]
-                        
-                    except Exception as e:
-                        error_container[0] = e
-                        try:
-                            hwp.Quit()
-                        except:
-                            pass
-                        try:
-                            pythoncom.CoUninitialize()
-                        except:
-                            pass
-                
-                # 스레드 시작 및 타임아웃 대기
-                import threading
-                thread = threading.Thread(target=hwp_extract_thread, daemon=True)
-                thread.start()
-                thread.join(timeout=hwp_timeout)
-                
-                if thread.is_alive():
-                    # 타임아웃 발생
-                    logger.warning(f"⏰ HWP 파일 처리 타임아웃 ({hwp_timeout}초) - Skip: {os.path.basename(file_path)}")
-                    self._log_skip(file_path, f"HWP 파일 처리 타임아웃 ({hwp_timeout}초)")
-                    if temp_file:
-                        self._cleanup_temp(temp_file)
-                    return None
-                
-                # 오류 확인
-                if error_container[0]:
-                    raise error_container[0]
+                finally:
+                    # 인스턴스는 남겨두고 문서만 닫음 (저장하지 않음)
+                    hwp.Clear(1)
                 
                 # 성공
-                if result_container[0]:
+                if text_parts:
                     logger.info(f"✅ HWP 파일 인덱싱 완료 (임시 복사본 사용): {os.path.basename(file_path)}")
-                    if temp_file:
-                        self._cleanup_temp(temp_file)
-                    return result_container[0]
+                    self._cleanup_temp(temp_file)
+                    return ''.join(text_parts)[:MAX_TEXT_LENGTH]
+                
+            except TimeoutError:
+                # 시간 초과로 취소됨 - 인스턴스 상태를 신뢰할 수 없으므로 종료
+                self._release_com_app("HWPFrame.HwpObject")
+                if temp_file:
+                    self._cleanup_temp(temp_file)
+                raise
                 
             except Exception as e:
-                logger.debug(f"HWP COM 추출 오류 [{file_path}]: {e}")
-                try:
-                    pythoncom.CoUninitialize()
-                except:
-                    pass
-                # 임시 파일 정리
+                logger.debug("HWP COM 추출 오류 [%s]: %s", file_path, e)
+                # 오류 후 인스턴스 상태를 신뢰할 수 없으므로 종료 (다음 파일에서 새로 생성)
+                if hwp is not None:
+                    self._release_com_app("HWPFrame.HwpObject")
+                # 임시 파일 정리 (olefile 시도 시 다시 복사)
                 if temp_file:
                     self._cleanup_temp(temp_file)
+                    temp_file = None
         
         # 2차 시도: olefile (제한적) - 임시 파일 사용
         if OLEFILE_AVAILABLE:
@@ -2394,30 +3206,30 @@ class FileIndexer:
                 if not temp_file:
                     return None
                 
-                ole = olefile.OleFileIO(temp_file)
-                if ole.exists('PrvText'):
-                    stream = ole.openstream('PrvText')
-                    data = stream.read()
-                    # HWP 텍스트는 UTF-16LE 인코딩
-                    text = data.decode('utf-16le', errors='ignore')
-                    ole.close()
-                    
-                    logger.debug(f"✅ HWP 파일 인덱싱 완료 (olefile, 임시 복사본): {os.path.basename(file_path)}")
-                    
-                    # 임시 파일 정리
-                    if temp_file:
-                        self._cleanup_temp(temp_file)
-                    
-                    return text[:100000]
-                ole.close()
+                olefile = _lazy_import('olefile')
+                # 파일을 메모리 매핑해서 olefile에 전달 (섹터 읽기가 페이지 캐시에서 바로 처리됨)
+                with open(temp_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    ole = olefile.OleFileIO(mm)
+                    try:
+                        if ole.exists('PrvText'):
+                            # HWP 텍스트는 UTF-16LE 인코딩 (문자당 2바이트) - 최대 길이만큼만 읽음
+                            data = ole.openstream('PrvText').read(MAX_TEXT_LENGTH * 2)
+                            text = data.decode('utf-16le', errors='ignore')
+                            
+                            logger.debug("✅ HWP 파일 인덱싱 완료 (olefile, 임시 복사본): %s", file_path)
+                            
+                            return text[:MAX_TEXT_LENGTH]
+                    finally:
+                        ole.close()
             except Exception as e:
-                logger.debug(f"HWP olefile 추출 오류 [{file_path}]: {e}")
+                logger.debug("HWP olefile 추출 오류 [%s]: %s", file_path, e)
             finally:
                 # 임시 파일 정리
                 if temp_file:
                     self._cleanup_temp(temp_file)
         
-        logger.debug(f"HWP 파일 추출 실패 [{file_path}]: 지원 라이브러리 없음")
+        logger.debug("HWP 파일 추출 실패 [%s]: 지원 라이브러리 없음", file_path)
         
         # 마지막 정리
         if temp_file:
@@ -2457,27 +3269,24 @@ class FileIndexer:
         logger.info("재시도 워커 동작 시작")
         
         while not self.retry_stop_flag.is_set():
-            # 대기 (5분 = 300초, 인터럽트 가능하도록 1초씩 체크)
-            for _ in range(self.retry_interval):
-                if self.retry_stop_flag.is_set():
-                    break
-                time.sleep(1)
-            
-            if self.retry_stop_flag.is_set():
+            # 대기 (5분 = 300초, 중지 요청 시 즉시 깨어남)
+            if self.retry_stop_flag.wait(timeout=self.retry_interval):
                 break
             
             # Skip된 파일 재시도
             with self.skipped_files_lock:
-                if not self.skipped_files:
-                    logger.info("재시도할 파일이 없습니다. 워커 종료.")
-                    break
-                
                 files_to_retry = list(self.skipped_files.keys())
             
+            if not files_to_retry:
+                logger.info("재시도할 파일이 없습니다. 워커 종료.")
+                self._save_retry_queue()
+                break
+            
             logger.info(f"Skip된 파일 재시도 시작: {len(files_to_retry)}개")
             
             retry_success = 0
             retry_failed = 0
+            pending = []  # DB 저장 대기 중인 성공 파일 (path, content, mtime, token_count)
             
             for file_path in files_to_retry:
                 if self.retry_stop_flag.is_set():
@@ -2495,73 +3304,44 @@ class FileIndexer:
                         logger.debug("▶️ 재시도 워커: 사용자 활동 없음 - 재개")
                 
                 try:
-                    # 파일이 존재하는지 확인
-                    if not os.path.exists(file_path):
+                    # 존재 여부/크기/mtime을 stat 한 번으로 조회
+                    try:
+                        file_stat = os.stat(file_path)
+                    except FileNotFoundError:
                         with self.skipped_files_lock:
                             if file_path in self.skipped_files:
                                 del self.skipped_files[file_path]
-                        logger.debug(f"파일 삭제됨, 재시도 목록에서 제거: {file_path}")
+                        logger.debug("파일 삭제됨, 재시도 목록에서 제거: %s", file_path)
                         continue
                     
                     # 파일 크기 재확인
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        if file_size > MAX_FILE_SIZE:
-                            with self.skipped_files_lock:
-                                if file_path in self.skipped_files:
-                                    del self.skipped_files[file_path]
-                            logger.debug(f"파일 크기 초과, 재시도 중단: {file_path}")
-                            continue
-                    except Exception:
-                        pass
+                    if file_stat.st_size > MAX_FILE_SIZE:
+                        with self.skipped_files_lock:
+                            if file_path in self.skipped_files:
+                                del self.skipped_files[file_path]
+                        logger.debug("파일 크기 초과, 재시도 중단: %s", file_path)
+                        continue
+                    
+                    # 반복 실패한 Office 문서는 전체 파싱 대신 문서 속성만 인덱싱
+                    with self.skipped_files_lock:
+                        retry_count = self.skipped_files.get(file_path, {}).get('retry_count', 0)
+                    degraded = (retry_count >= RETRY_DEGRADED_THRESHOLD and
+                                os.path.splitext(file_path)[1].lower() in MINIMAL_EXTRACT_EXTENSIONS)
                     
                     # 텍스트 추출 재시도
-                    content = self._extract_text_safe(file_path)
+                    if degraded:
+                        content = self._extract_minimal(file_path)
+                    else:
+                        content = self._extract_text_safe(file_path)
                     
                     if content:
-                        # 성공! DB에 저장
-                        current_mtime = os.path.getmtime(file_path)
-                        token_count = self._count_tokens(content)
-                        
-                        # 이미 DB에 있는지 확인
-                        indexed_mtime = self.db.get_file_mtime(file_path)
-                        
-                        try:
-                            if indexed_mtime is not None:
-                                # 업데이트
-                                self.db.update_file(file_path, content, current_mtime)
-                            else:
-                                # 새로 삽입
-                                self.db.insert_file(file_path, content, current_mtime)
-                            
-                            # 재시도 목록에서 제거
-                            with self.skipped_files_lock:
-                                if file_path in self.skipped_files:
-                                    retry_info = self.skipped_files[file_path]
-                                    del self.skipped_files[file_path]
-                                    logger.info(f"재시도 성공 [{file_path}] - 이전 사유: {retry_info['reason']}")
-                            
-                            retry_success += 1
-                            
-                            # UI 로그 콜백 및 메모리에 로그 추가 - DB 저장 완료 상태
-                            filename = os.path.basename(file_path)
-                            db_status = "✓ DB 저장 완료 (재시도)"
-                            detail = f'{len(content):,}자 / {token_count:,}토큰 | {db_status}'
-                            
-                            # 통합 로그에 기록
-                            self._write_indexing_log('Retry Success', file_path, detail)
-                            
-                            # Indexed.txt에 기록 (재시도 성공도 인덱싱 성공)
-                            self._write_indexed_file(file_path, len(content), token_count, content)
-                            
-                            self._add_log_to_memory('Retry Success', file_path, detail)
-                            
-                            if self.log_callback:
-                                self.log_callback('Retry Success', filename, detail)
-                        
-                        except Exception as e:
-                            logger.error(f"재시도 DB 저장 오류 [{file_path}]: {e}")
-                            retry_failed += 1
+                        # 성공! 모아서 한 트랜잭션으로 DB에 저장
+                        pending.append((file_path, content, file_stat.st_mtime, self._count_tokens(content), degraded))
+                        if len(pending) >= RETRY_SAVE_BATCH_SIZE:
+                            saved = self._save_retry_batch(pending)
+                            retry_success += saved
+                            retry_failed += len(pending) - saved
+                            pending.clear()
                     
                     else:
                         # 여전히 실패 - 무제한 재시도 (요구사항: 사용자가 사용중이면 절대 프로그램을 닫지 않도록 함)
@@ -2569,7 +3349,7 @@ class FileIndexer:
                             if file_path in self.skipped_files:
                                 self.skipped_files[file_path]['retry_count'] += 1
                                 retry_count = self.skipped_files[file_path]['retry_count']
-                                logger.debug(f"재시도 실패 (재시도 횟수: {retry_count}회): {file_path}")
+                                logger.debug("재시도 실패 (재시도 횟수: %s회): %s", retry_count, file_path)
                         
                         retry_failed += 1
                 
@@ -2577,10 +3357,102 @@ class FileIndexer:
                     logger.error(f"재시도 중 오류 [{file_path}]: {e}")
                     retry_failed += 1
             
+            # 남은 성공 파일 저장
+            if pending:
+                saved = self._save_retry_batch(pending)
+                retry_success += saved
+                retry_failed += len(pending) - saved
+            
             logger.info(f"재시도 완료: 성공 {retry_success}개, 실패 {retry_failed}개")
+            
+            # 성공/삭제된 파일이 빠지고 재시도 횟수가 갱신된 큐 저장
+            self._save_retry_queue()
         
         logger.info("재시도 워커 종료")
     
+    def _save_retry_batch(self, batch: List[tuple]) -> int:
+        """
+        재시도에 성공한 파일들을 한 트랜잭션으로 DB에 저장하고 재시도 목록에서 제거
+        
+        Args:
+            batch: [(path, content, mtime, token_count, degraded), ...]
+                   degraded=True면 문서 속성만 저장한 파일 (다음 인덱싱에서 전체 추출 재시도)
+        
+        Returns:
+            저장된 파일 수 (저장 실패 시 0 - 다음 재시도에서 다시 시도)
+        """
+        try:
+            self.db.update_files_batch([(path, content, mtime) for path, content, mtime, _, _ in batch])
+        except Exception as e:
+            logger.error(f"재시도 DB 저장 오류 ({len(batch)}개 파일): {e}")
+            return 0
+        
+        # 저장된 내용이 기존 내용 해시와 다를 수 있으므로 해시 삭제 (같은 내용의 다른 파일이 이 텍스트를 재사용하지 않도록)
+        self.db.set_content_hashes([(path, '', None) for path, _, _, _, _ in batch])
+        with self._retry_saved_lock:
+            self._retry_saved_paths.update(path for path, _, _, _, _ in batch)
+        
+        self.db.set_degraded_files([path for path, _, _, _, degraded in batch if degraded])
+        
+        for file_path, content, _, token_count, degraded in batch:
+            # 재시도 목록에서 제거
+            with self.skipped_files_lock:
+                if file_path in self.skipped_files:
+                    retry_info = self.skipped_files[file_path]
+                    del self.skipped_files[file_path]
+                    logger.info(f"재시도 성공 [{file_path}] - 이전 사유: {retry_info['reason']}")
+            
+            # UI 로그 콜백 및 메모리에 로그 추가 - DB 저장 완료 상태
+            filename = os.path.basename(file_path)
+            db_status = "✓ DB 저장 완료 (재시도, 문서 속성만)" if degraded else "✓ DB 저장 완료 (재시도)"
+            detail = f'{len(content):,}자 / {token_count:,}토큰 | {db_status}'
+            
+            # 통합 로그에 기록
+            self._write_indexing_log('Retry Success', file_path, detail)
+            
+            # Indexed.txt에 기록 (재시도 성공도 인덱싱 성공)
+            self._write_indexed_file(file_path, len(content), token_count, content)
+            
+            self._add_log_to_memory('Retry Success', file_path, detail)
+            
+            if self.log_callback:
+                self.log_callback('Retry Success', filename, detail)
+        
+        return len(batch)
+    
+    def _extract_minimal(self, file_path: str) -> Optional[str]:
+        """
+        반복 실패한 Office 문서의 최소 정보 추출 (docProps/core.xml 문서 속성만)
+        
+        본문 파싱 없이 zip 목록과 문서 속성 파트만 읽으므로 손상/대용량 문서도 즉시 처리됩니다.
+        
+        Returns:
+            제목/주제/작성자/키워드 등 문서 속성 텍스트 또는 None (속성 없음)
+        """
+        temp_file = self._copy_to_temp(file_path)
+        if not temp_file:
+            return None
+        
+        try:
+            with zipfile.ZipFile(temp_file) as z:
+                if 'docProps/core.xml' not in z.NameToInfo:
+                    return None
+                root = ET.fromstring(z.read('docProps/core.xml'))
+            
+            # 태그의 네임스페이스를 떼고 필드 이름으로 조회
+            properties = {el.tag.rsplit('}', 1)[-1]: el.text.strip()
+                          for el in root if el.text and el.text.strip()}
+            values = [properties[field] for field in DOC_PROPERTY_FIELDS if field in properties]
+            
+            return '\n'.join(values)[:MAX_TEXT_LENGTH] if values else None
+        
+        except Exception as e:
+            logger.debug("문서 속성 추출 오류 [%s]: %s", file_path, e)
+            return None
+        
+        finally:
+            self._cleanup_temp(temp_file)
+    
     def get_skipped_files_count(self) -> int:
         """현재 재시도 대기 중인 파일 수 반환"""
         with self.skipped_files_lock:
@@ -2613,7 +3485,7 @@ if __name__ == "__main__":
     print(f"\n=== 인덱싱 통계 ===")
     print(f"총 파일: {stats['total_files']}")
     print(f"인덱싱됨: {stats['indexed_files']}")
-    print(f"스킵됨: {stats['skipped_files']}")
+    print(f"스킵됨: {stats['skipped_files']} (변경 없음: {stats['unchanged_files']})")
     print(f"오류: {stats['error_files']}")
     
     # 검색 테스트
@@ -15,12 +15,16 @@ from datetime import datetime
 # UTF-8 전역 설정 (최우선 실행)
 # ========================================
 # Windows 콘솔 코드 페이지를 UTF-8로 설정
+# 대화형 콘솔에서만 적용하고, 이미 UTF-8이면 다시 설정하지 않음
 if sys.platform == 'win32':
     try:
-        import ctypes
-        kernel32 = ctypes.windll.kernel32
-        kernel32.SetConsoleCP(65001)
-        kernel32.SetConsoleOutputCP(65001)
+        if sys.stdout is not None and sys.stdout.isatty():
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if kernel32.GetConsoleCP() != 65001:
+                kernel32.SetConsoleCP(65001)
+            if kernel32.GetConsoleOutputCP() != 65001:
+                kernel32.SetConsoleOutputCP(65001)
     except Exception:
         pass
 
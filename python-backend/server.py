@@ -4,7 +4,7 @@ API 서버 - Electron과 Python 백엔드 통신
 Flask 기반 REST API
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import logging
 import threading
@@ -13,17 +13,23 @@ import os
 import atexit
 import io
 import json
+import time
+import gzip
 
 # ========================================
 # UTF-8 전역 설정 (최우선 실행)
 # ========================================
 # Windows 콘솔 코드 페이지를 UTF-8로 설정 (Python 실행 전 필수)
+# 대화형 콘솔에서만 적용하고, 이미 UTF-8이면 다시 설정하지 않음
 if sys.platform == 'win32':
     try:
-        import ctypes
-        kernel32 = ctypes.windll.kernel32
-        kernel32.SetConsoleCP(65001)  # UTF-8 입력
-        kernel32.SetConsoleOutputCP(65001)  # UTF-8 출력
+        if sys.stdout is not None and sys.stdout.isatty():
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if kernel32.GetConsoleCP() != 65001:
+                kernel32.SetConsoleCP(65001)  # UTF-8 입력
+            if kernel32.GetConsoleOutputCP() != 65001:
+                kernel32.SetConsoleOutputCP(65001)  # UTF-8 출력
     except Exception:
         pass
 
@@ -89,6 +95,35 @@ app.config['JSON_AS_ASCII'] = False  # UTF-8 인코딩 강제 (한글 등 유니
 app.config['JSONIFY_MIMETYPE'] = 'application/json; charset=utf-8'
 CORS(app)  # CORS 허용
 
+# 응답 압축 설정 (이 크기 이상인 JSON 응답만 gzip 압축)
+GZIP_MIN_SIZE = 1024
+
+
+@app.after_request
+def compress_response(response):
+    """클라이언트가 gzip을 지원하면 큰 JSON 응답 본문을 압축"""
+    try:
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype != 'application/json'
+                or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+            return response
+        
+        body = response.get_data()
+        if len(body) < GZIP_MIN_SIZE:
+            return response
+        
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Content-Length'] = str(len(response.get_data()))
+        response.vary.add('Accept-Encoding')
+    except Exception as e:
+        logger.error(f"응답 압축 오류: {e}")
+    
+    return response
+
 # 전역 객체
 db_manager: DatabaseManager = None
 indexer: FileIndexer = None
@@ -141,6 +176,9 @@ def initialize():
     indexer = FileIndexer(db_manager, enable_activity_monitor=enable_activity_monitor)
     logger.info(f"파일 인덱서 초기화 완료 (활동 모니터: {enable_activity_monitor})")
     
+    # 이전 실행에서 Skip된 파일 재시도 (저장된 재시도 큐 복원)
+    indexer.resume_retry_queue()
+    
     # 검색 엔진 초기화
     search_engine = SearchEngine(db_manager)
     logger.info("검색 엔진 초기화 완료")
@@ -230,7 +268,7 @@ def start_indexing():
         
         # 진행 상황 콜백 (실제로는 WebSocket이나 SSE 사용 권장)
         def progress_callback(current, total, path):
-            logger.info(f"인덱싱 진행: [{current}/{total}] {path}")
+            logger.info("인덱싱 진행: [%d/%d] %s", current, total, path)
         
         success = indexer.start_indexing(paths, progress_callback)
         
@@ -286,6 +324,57 @@ def indexing_status():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/indexing/stream', methods=['GET'])
+def indexing_stream():
+    """
+    인덱싱 진행 상황 SSE 스트림 (text/event-stream)
+    
+    상태가 실제로 바뀔 때만 progress 이벤트를 보내고,
+    인덱싱이 끝나면 done 이벤트 후 스트림을 종료합니다.
+    연결 유지를 위해 주기적으로 heartbeat 코멘트를 보냅니다.
+    """
+    check_interval = 0.5  # 상태 확인 주기 (초, 프로세스 내부 확인이므로 저렴)
+    heartbeat_interval = 15  # heartbeat 주기 (초)
+    
+    def generate():
+        last_state = None
+        last_sent = time.time()
+        
+        while True:
+            stats = indexer.get_stats()
+            is_running = indexer.is_running
+            state = (stats.get('indexed_files', 0), stats.get('total_files', 0), is_running)
+            
+            if state != last_state:
+                last_state = state
+                last_sent = time.time()
+                payload = json.dumps({
+                    'indexed': state[0],
+                    'total': state[1],
+                    'is_running': is_running
+                })
+                yield f"event: progress\ndata: {payload}\n\n"
+            elif time.time() - last_sent >= heartbeat_interval:
+                last_sent = time.time()
+                yield ": heartbeat\n\n"
+            
+            if not is_running:
+                yield f"event: done\ndata: {json.dumps({'stats': stats})}\n\n"
+                break
+            
+            time.sleep(check_interval)
+    
+    try:
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    except Exception as e:
+        logger.error(f"인덱싱 스트림 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/indexing/logs', methods=['GET'])
 def indexing_logs():
     """
@@ -463,6 +552,7 @@ def search_combined():
         query = data.get('query', '')
         search_path = data.get('search_path', None)
         max_results = data.get('max_results', 100)
+        offset = max(0, int(data.get('offset', 0)))
         
         if not query:
             return jsonify({'error': 'Query is required'}), 400
@@ -470,12 +560,12 @@ def search_combined():
         # 검색어 파싱
         parsed = search_engine.parse_search_query(query)
         
-        # 통합 검색 실행
+        # 통합 검색 실행 (offset 이후 max_results개 페이지만 반환)
         results = search_engine.search_combined(
             parsed['escaped_query'], 
             search_path, 
-            max_results
-        )
+            offset + max_results
+        )[offset:]
         
         # 검색 시간 계산
         search_time = time_module.time() - start_time
@@ -484,6 +574,7 @@ def search_combined():
             'query': query,
             'parsed': parsed,
             'count': len(results),
+            'offset': offset,
             'results': results,
             'search_time': round(search_time, 3)
         })
@@ -493,6 +584,48 @@ def search_combined():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/search/combined/stream', methods=['POST'])
+def search_combined_stream():
+    """
+    통합 검색 결과 스트리밍 (NDJSON, 결과 1개당 한 줄)
+    
+    요청 형식은 /api/search/combined와 동일합니다.
+    검색 자체는 응답 전에 끝까지 실행되고, 결과 전송만 줄 단위로 스트리밍됩니다.
+    클라이언트는 전체 응답을 기다리지 않고 줄 단위로 결과를 처리할 수 있습니다.
+    """
+    try:
+        data = request.json
+        query = data.get('query', '')
+        search_path = data.get('search_path', None)
+        max_results = data.get('max_results', 100)
+        offset = max(0, int(data.get('offset', 0)))
+        
+        if not query:
+            return jsonify({'error': 'Query is required'}), 400
+        
+        parsed = search_engine.parse_search_query(query)
+        
+        # 검색은 응답 헤더 전송 전에 실행 (오류를 이 try에서 로깅하고 500으로 반환)
+        results = search_engine.search_combined(
+            parsed['escaped_query'],
+            search_path,
+            offset + max_results
+        )[offset:]
+        
+        def generate():
+            for result in results:
+                yield json.dumps(result, ensure_ascii=False) + '\n'
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson'
+        )
+    
+    except Exception as e:
+        logger.error(f"통합 검색 스트림 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/indexing/indexed-content', methods=['POST'])
 def get_indexed_content():
     """인덱싱된 파일의 내용 조회"""
@@ -500,14 +633,22 @@ def get_indexed_content():
         data = request.json
         file_path = data.get('path', '')
         
+        max_chars = data.get('max_chars')
+        
         if not file_path:
             return jsonify({'error': 'Path is required'}), 400
         
-        # DB에서 내용 조회
-        results = db_manager.conn.execute(
-            "SELECT content, mtime FROM files_fts WHERE path = ?",
-            (file_path,)
-        ).fetchone()
+        # DB에서 내용 조회 (max_chars가 있으면 필요한 앞부분만 읽음)
+        if max_chars:
+            results = db_manager.conn.execute(
+                "SELECT substr(content, 1, ?) AS content, mtime FROM files_fts WHERE path = ?",
+                (int(max_chars), file_path)
+            ).fetchone()
+        else:
+            results = db_manager.conn.execute(
+                "SELECT content, mtime FROM files_fts WHERE path = ?",
+                (file_path,)
+            ).fetchone()
         
         if results:
             return jsonify({
@@ -9,6 +9,7 @@ export interface IndexingStats {
   total_files: number;
   indexed_files: number;
   skipped_files: number;
+  unchanged_files?: number;
   error_files: number;
   start_time: number | null;
   end_time: number | null;